@@ -21,15 +21,17 @@ Usage::
     math_engine.evaluate("x + 1", x=4)          # Decimal('5')
 """
 
-from . import calculator
-from .calculator import ScientificEngine
+from functools import lru_cache
+from typing import Any, Mapping, Optional, Union
+
+# config_manager must be bound before calculator.calculator is imported:
+# that module does ``from math_engine import config_manager``.
 from .utility import config_manager as config_manager
 from .utility import plugin_manager, error as E
-from.calculator.calculator import calculate
-from .utility import config_manager as config_manager
-from typing import Optional
-from typing import Union
-from typing import Any, Mapping
+from . import calculator
+from .calculator import ScientificEngine
+from .calculator.calculator import calculate
+from .calculator import float_compiler
 
 __version__ = "0.6.6"
 
@@ -136,8 +138,8 @@ def load_all_settings():
     Returns:
         dict: All configuration key-value pairs.
     """
-    settings =  config_manager.load_setting_value("all")
-    return settings
+    # Copy so callers can't mutate the shared cached dictionary
+    return dict(config_manager.load_all_cached())
 
 def load_one_setting(setting):
     """Return the value of a single configuration setting.
@@ -151,6 +153,78 @@ def load_one_setting(setting):
     settings = config_manager.load_setting_value(setting)
     return settings
 
+# ---------------------------------------------------------------------------
+# Error diagnostics
+# ---------------------------------------------------------------------------
+# Kept out of evaluate()/validate() so their success path stays short.
+
+# Labels for the diagnostic output
+_ERROR_MESSAGE_LABEL = "Errormessage: "
+_CODE_LABEL = "Code: "
+_EQUATION_LABEL = "Equation: "
+
+# Output templates; the underline uses ANSI escape codes.
+_UNDERLINED_EQUATION = _EQUATION_LABEL + "{head}\033[4m{mid}\033[0m{tail}"
+_POINTER_RANGE = "{pad}^ HERE IS THE PROBLEM (Position: {start} - {end})"
+_POINTER_SINGLE = "{pad}^ HERE IS THE PROBLEM (Position: {start})"
+
+
+def _pointer_line(position_start, position_end, indent):
+    """Return the ``^ HERE IS THE PROBLEM`` line, indented by *indent* columns."""
+    if position_start != position_end:
+        pad = round((position_end - position_start) / 2) + position_start + indent
+        return _POINTER_RANGE.format(pad=f"{'':{pad}}", start=position_start, end=position_end)
+    return _POINTER_SINGLE.format(pad=f"{'':{position_start + indent}}", start=position_start)
+
+
+@lru_cache(maxsize=128)
+def _format_math_error(equation, message, code, position_start, position_end, is_cli):
+    """Build the diagnostic text for a MathError (cached for repeated failures).
+
+    Returns:
+        str: The lines to print, joined with newlines.
+    """
+    if position_start != -1 and position_end == -1:
+        position_end = position_start
+
+    # --- CLI-style output: pointer appears above the expression ---
+    if is_cli:
+        if position_start != -1:
+            lines = [_pointer_line(position_start, position_end, 4)]
+        else:
+            lines = []
+        lines += [_CODE_LABEL + code, _ERROR_MESSAGE_LABEL + message]
+        if position_start == -1:
+            lines.append(_EQUATION_LABEL + equation)
+        lines.append(" ")
+        return "\n".join(lines)
+
+    # --- Library-style output: underlined error segment in equation ---
+    lines = [_ERROR_MESSAGE_LABEL + message, _CODE_LABEL + code]
+    if position_start != -1:
+        lines.append(_UNDERLINED_EQUATION.format(
+            head=equation[:position_start],
+            mid=equation[position_start:position_end + 1],
+            tail=equation[position_end + 1:],
+        ))
+        lines.append(_pointer_line(position_start, position_end, len(_EQUATION_LABEL)))
+    else:
+        lines.append(_EQUATION_LABEL + equation)
+    return "\n".join(lines)
+
+
+def _render_math_error(e, is_cli):
+    """Print a human-readable diagnostic for a MathError.
+
+    Args:
+        e:      The caught ``E.MathError``.
+        is_cli: ``True`` for CLI layout (pointer above the expression),
+                ``False`` for library layout (underlined equation).
+    """
+    print(_format_math_error(str(e.equation), str(e.message), str(e.code),
+                             e.position_start, e.position_end, is_cli))
+
+
 def evaluate(expr: str,
              variables: Optional[Mapping[str, Any]] = None,
              is_cli: bool = False,
@@ -190,13 +264,10 @@ def evaluate(expr: str,
     """
     # Merge variable sources: memory < variables dict < keyword args
     if variables is None:
-        merged = dict(kwvars)
+        merged = {**memory, **kwvars}
     else:
-        merged = dict(variables)
-        merged.update(kwvars)
-    global memory
-    merged = dict(list(memory.items()) + list(merged.items()))
-    settings = load_all_settings()
+        merged = {**memory, **variables, **kwvars}
+    settings = config_manager.load_all_cached()
 
     # --- Path 1: Exception mode (readable_error=False) ---
     # Exceptions propagate directly to the caller.
@@ -216,57 +287,7 @@ def evaluate(expr: str,
 
             return result
         except E.MathError as e:
-            # Labels for the diagnostic output
-            Errormessage = "Errormessage: "
-            code = "Code: "
-            Equation = "Equation: "
-            positon_start = e.position_start
-            positon_end = e.position_end
-
-            # --- CLI-style output: pointer appears above the expression ---
-            if is_cli:
-                if positon_start != -1:
-                    if positon_end == -1:
-                        positon_end = positon_start
-                    if positon_start != positon_end:
-                        print((round((positon_end - positon_start) / 2) + positon_start + 4) * " " + "^ HERE IS THE PROBLEM (Position: " + str(positon_start) + " - " + str(
-                            positon_end) + ")")
-                    else:
-                        print((positon_start + 4) * " " + "^ HERE IS THE PROBLEM (Position: " + str(
-                            positon_start) + ")")
-                    print(code + str(e.code))
-                    print(Errormessage + str(e.message))
-                    print(" ")
-                else:
-                    print(code + str(e.code))
-                    print(Errormessage + str(e.message))
-                    print(Equation + str(e.equation))
-                    print(" ")
-
-            # --- Library-style output: underlined error segment in equation ---
-            if is_cli == False:
-                print(Errormessage + str(e.message))
-                print(code + str(e.code))
-                if positon_start != -1:
-                    if positon_end == -1:
-                        positon_end = positon_start
-                    calc_equation = str(e.equation)
-                    # Underline the problematic segment using ANSI escape codes
-                    print(
-                        Equation + calc_equation[:positon_start] + "\033[4m" + calc_equation[
-                                                                               positon_start:positon_end + 1] + "\033[0m" + calc_equation[
-                                                                                                                            positon_end + 1:]
-                    )
-                    if positon_start != positon_end:
-                        print((round((positon_end - positon_start) / 2) + positon_start + len(
-                            Equation)) * " " + "^ HERE IS THE PROBLEM (Position: " + str(positon_start) + " - " + str(
-                            positon_end) + ")")
-                    else:
-                        print((positon_start + len(Equation)) * " " + "^ HERE IS THE PROBLEM (Position: " + str(
-                            positon_start) + ")")
-                else:
-                    print(Equation + str(e.equation))
-
+            _render_math_error(e, is_cli)
 
 
 def validate(expr: str,
@@ -291,46 +312,121 @@ def validate(expr: str,
     """
     explanation = False
     if variables is None:
-        merged = dict(kwvars)
+        merged = {**memory, **kwvars}
     else:
-        merged = dict(variables)
-        merged.update(kwvars)
-    global memory
-    merged = dict(list(memory.items()) + list(merged.items()))
+        merged = {**memory, **variables, **kwvars}
     result = -1
     try:
         result = calculate(expr, merged, 0)  # 0 = Validate, 1 = Calculate
         return result
 
     except E.MathError as e:
-        Errormessage = "Errormessage: "
-        code = "Code: "
-        Equation = "Equation: "
-        positon_start = e.position_start
-        positon_end = e.position_end
-
-        print(Errormessage + str(e.message))
-        print(code + str(e.code))
-        if positon_start != -1:
-            if positon_end == -1:
-                positon_end = positon_start
-            calc_equation = str(e.equation)
-            print(
-                Equation + calc_equation[:positon_start] + "\033[4m" + calc_equation[
-                                                                       positon_start:positon_end + 1] + "\033[0m" + calc_equation[
-                                                                                                                    positon_end + 1:]
-            )
-            if positon_start != positon_end:
-                print((round((positon_end - positon_start) / 2) + positon_start + len(
-                    Equation)) * " " + "^ HERE IS THE PROBLEM (Position: " + str(positon_start) + " - " + str(
-                    positon_end) + ")")
-            else:
-                print((positon_start + len(Equation)) * " " + "^ HERE IS THE PROBLEM (Position: " + str(
-                    positon_start) + ")")
-        else:
-            print(Equation + str(e.equation))
+        _render_math_error(e, False)
 
 
+def _parse_for_numeric(expr: str):
+    """Parse *expr* for the float paths.
+
+    Returns:
+        tuple: ``(tree, placeholders)`` where ``placeholders`` maps the
+        tokenizer's ``"var<N>"`` names back to the variable letters.
+    """
+    settings = config_manager.load_all_cached()
+    tokens, _, token_spans = calculator.calculator.cached_translator(expr, {}, settings)
+    # The tokenizer replaces letters with "var<N>" placeholders; map them back
+    placeholders = {token: span[2] for token, span in zip(tokens, token_spans)
+                    if isinstance(token, str) and token.startswith("var")}
+    tree = calculator.calculator.cached_ast(expr, settings, {})[0]
+    return tree, placeholders
+
+
+def evaluate_batch(expr: str, **arrays: Any) -> Any:
+    """Evaluate an expression for whole arrays of variable values at once.
+
+    The expression is parsed once and evaluated with NumPy ufuncs, one
+    vectorized pass per operator, instead of calling ``evaluate()`` for every
+    input.  Intended for parameter sweeps and plotting; results use float64 /
+    int64 semantics rather than ``Decimal`` and output prefixes are ignored.
+
+    Args:
+        expr:     The expression string (e.g., ``"3*x + y"``).  Variables are
+                  single letters, as for the equation solver.
+        **arrays: One array-like per variable (e.g., ``x=numpy.arange(10)``).
+
+    Returns:
+        numpy.ndarray: The element-wise results.
+
+    Raises:
+        ImportError: If numpy is not installed.
+        E.SolverError: If no array is given for a variable (code ``3005``).
+        E.MathError: (or a subclass) if the expression is invalid.
+    """
+    tree, placeholders = _parse_for_numeric(expr)
+    missing = [name for name in placeholders.values() if name not in arrays]
+    if missing:
+        raise E.SolverError(f"No value given for variable '{missing[0]}'.", code="3005")
+    env = {placeholder: arrays[name] for placeholder, name in placeholders.items()}
+    return float_compiler.evaluate_array(tree, env)
+
+
+def compile_expression(expr: str):
+    """Compile an expression into a fast float function of its variables.
+
+    The expression is parsed and compiled once (JIT-compiled with ``numba``
+    when installed); calling the result only runs the compiled arithmetic.
+    Intended for loops that evaluate one expression for many scalar inputs.
+    Results are ``float`` (``bool`` for ``=``); when float64 cannot represent
+    a result the exact ``Decimal`` value is returned instead.
+
+    Args:
+        expr: The expression string (e.g., ``"x**2 + 3*x"``).
+
+    Returns:
+        Callable: ``f(**values)`` taking one keyword argument per variable
+        (e.g., ``f(x=2.5)``).
+
+    Raises:
+        E.MathError: (or a subclass) if the expression is invalid, or on
+            evaluation errors such as division by zero.
+    """
+    tree, placeholders = _parse_for_numeric(expr)
+    function, names = float_compiler.compile_float(tree)
+    letters = [placeholders[name] for name in names]
+
+    def compiled(**values):
+        missing = [letter for letter in letters if letter not in values]
+        if missing:
+            raise E.SolverError(f"No value given for variable '{missing[0]}'.", code="3005")
+        return function(*[values[letter] for letter in letters])
+
+    return compiled
+
+
+def set_precision(precision: int):
+    """Set the minimum Decimal precision (significant digits) for evaluation.
+
+    The engine still raises the precision automatically for long inputs and
+    large ``decimal_places`` values; this only changes the floor (default
+    ``100``).  Lower values speed up short calculations.
+
+    Args:
+        precision: Number of significant digits.
+
+    Raises:
+        E.ConfigError: If *precision* is not a whole number in range (code ``5004``).
+    """
+    calculator.calculator.set_min_precision(precision)
+
+
+def clear_cache():
+    """Drop the cached parse results of earlier ``evaluate()`` calls.
+
+    Repeated expressions are parsed once and reused; this frees that memory.
+    Results are unaffected, since the cache already tracks settings,
+    variables, and newly registered plugin functions.
+    """
+    calculator.calculator.clear_parse_cache()
+
 
 def reset_settings():
     """Reset all settings to their factory defaults.
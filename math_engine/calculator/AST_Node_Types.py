@@ -14,11 +14,243 @@ Each node implements:
 - ``evaluate()``          — recursively compute the numeric value
 - ``collect_term(var)``   — decompose the subtree into
   ``(factor_of_var, constant)`` for the linear equation solver
+- ``compile()``           — lower the subtree to flat postorder bytecode that
+  :func:`run` executes on a simple stack machine
 """
 
+import decimal
+import sys
+import warnings
 from decimal import Decimal
 from ..utility import error as E
 
+# The whole engine runs on Decimal, so the C implementation (libmpdec) is
+# essential for performance.  The pure-Python fallback (_pydecimal) is one to
+# two orders of magnitude slower -- make that visible instead of silently slow.
+# Note: the operators (``a + b``) are intentionally used instead of bound
+# context methods (``getcontext().add``); with _decimal the operator path is
+# the faster of the two and it always honours the active local context.
+if not hasattr(decimal, "__libmpdec_version__"):
+    warnings.warn(
+        "math_engine: the C-accelerated 'decimal' module is not available; "
+        "calculations will fall back to the much slower pure-Python implementation.",
+        RuntimeWarning,
+        stacklevel=2,
+    )
+
+# Optional GMP backend for exact integer powers.  ``gmpy2.mpz`` exponentiation
+# is considerably faster than both libmpdec and Python ints for large operands;
+# without gmpy2 the builtin ``int`` is used, which is still exact.
+try:
+    from gmpy2 import mpz as _big_int
+except ImportError:
+    _big_int = int
+
+# Upper bound (in bits) for the exact integer power fast path.  Anything larger
+# is left to Decimal, which rounds to the context precision instead of
+# materialising a huge integer first.
+_INT_POW_MAX_BITS = 40000
+
+
+# ---------------------------------------------------------------------------
+# Operator handlers for BinOp.evaluate()
+# ---------------------------------------------------------------------------
+# Every handler receives both evaluated operands plus the BinOp node itself
+# (used for the operator name and the source position in error messages).
+
+def _is_integral(value):
+    """Return True if a Decimal has no fractional part (``2`` and ``2.0`` alike).
+
+    Comparing against ``to_integral_value()`` is cheaper than ``value % 1``
+    (no remainder division) and than inspecting ``as_tuple()`` (no digit tuple
+    allocation), and unlike an exponent check it also accepts ``2.0``.
+
+    Raises:
+        E.CalculationError: (code ``3026``) for infinities/NaN and for
+            non-zero values whose integer part is wider than the working
+            precision: their low digits were rounded away, so ``int()`` would
+            silently return a different number.  ``value % 1`` signalled
+            both cases with ``DivisionImpossible``/``InvalidOperation``.
+    """
+    if not value.is_finite() or (value.adjusted() >= decimal.getcontext().prec and value != 0):
+        raise E.CalculationError("Number too large or invalid operation (Arithmetic overflow).", code="3026")
+    return value == value.to_integral_value()
+
+
+def _check_int(left_value, right_value, node):
+    """Guard: bitwise operators require both operands to be integers."""
+    if not (_is_integral(left_value) and _is_integral(right_value)):
+        raise E.CalculationError(f"Operator '{node.operator}' requires integers.", code="3042", position_start=node.position_start)
+
+
+def _eval_add(left_value, right_value, node):
+    return left_value + right_value
+
+
+def _eval_sub(left_value, right_value, node):
+    return left_value - right_value
+
+
+def _eval_mul(left_value, right_value, node):
+    return left_value * right_value
+
+
+def _eval_div(left_value, right_value, node):
+    if right_value == 0:
+        raise E.CalculationError("Division by zero", code="3003", position_start=node.position_start)
+    return left_value / right_value
+
+
+def _is_plain_int(value):
+    """Return True for a Decimal written as a plain integer (exponent 0)."""
+    return value.as_tuple().exponent == 0
+
+
+def _eval_pow(left_value, right_value, node):
+    # Integer base with a small non-negative integer exponent: compute exactly
+    # on integers and round once through the current context (unary plus).
+    # 0**0 is excluded so Decimal keeps raising InvalidOperation for it.
+    if _is_plain_int(left_value) and _is_plain_int(right_value) and right_value > 0:
+        base = int(left_value)
+        exponent = int(right_value)
+        if base.bit_length() * exponent <= _INT_POW_MAX_BITS:
+            return +Decimal(int(_big_int(base) ** exponent))
+    return left_value ** right_value
+
+
+def _eval_eq(left_value, right_value, node):
+    # Equality returns a bool, not a Decimal
+    return left_value == right_value
+
+
+def _eval_bitand(left_value, right_value, node):
+    _check_int(left_value, right_value, node)
+    return Decimal(int(left_value) & int(right_value))
+
+
+def _eval_bitor(left_value, right_value, node):
+    _check_int(left_value, right_value, node)
+    return Decimal(int(left_value) | int(right_value))
+
+
+def _eval_bitxor(left_value, right_value, node):
+    _check_int(left_value, right_value, node)
+    return Decimal(int(left_value) ^ int(right_value))
+
+
+def _eval_shl(left_value, right_value, node):
+    _check_int(left_value, right_value, node)
+    return Decimal(int(left_value) << int(right_value))
+
+
+def _eval_shr(left_value, right_value, node):
+    _check_int(left_value, right_value, node)
+    return Decimal(int(left_value) >> int(right_value))
+
+
+# Maps operator strings to their evaluation handler.
+_EVAL_OPS = {
+    '+': _eval_add,
+    '-': _eval_sub,
+    '*': _eval_mul,
+    '/': _eval_div,
+    '**': _eval_pow,
+    '=': _eval_eq,
+    '&': _eval_bitand,
+    '|': _eval_bitor,
+    '^': _eval_bitxor,
+    '<<': _eval_shl,
+    '>>': _eval_shr,
+}
+
+
+# ---------------------------------------------------------------------------
+# Operator handlers for BinOp.collect_term()
+# ---------------------------------------------------------------------------
+# Each handler combines the ``(factor, constant)`` pairs of both subtrees.
+# Each subtree is expressed as:  factor * var_name + constant
+# where "factor" is the coefficient of the unknown variable and
+# "constant" is the purely numeric part.
+
+def _collect_add(left_factor, left_constant, right_factor, right_constant, node):
+    # (a*x + b) + (c*x + d) = (a+c)*x + (b+d)
+    return (left_factor + right_factor, left_constant + right_constant)
+
+
+def _collect_sub(left_factor, left_constant, right_factor, right_constant, node):
+    # (a*x + b) - (c*x + d) = (a-c)*x + (b-d)
+    return (left_factor - right_factor, left_constant - right_constant)
+
+
+def _collect_mul(left_factor, left_constant, right_factor, right_constant, node):
+    # (a*x + b) * (c*x + d) is linear ONLY when at most one side
+    # contains the variable.  If both sides have a non-zero factor
+    # the product introduces an x^2 term, which is non-linear.
+    if left_factor != 0 and right_factor != 0:
+        # Both sides depend on x  =>  x * x = x^2  =>  non-linear
+        raise E.SyntaxError("x^x Error (Non-linear).", code="3005", position_start=node.position_start)
+
+    elif left_factor == 0:
+        # Left side is a pure constant k.
+        # k * (c*x + d) = (k*c)*x + (k*d)
+        return (left_constant * right_factor, left_constant * right_constant)
+
+    else:
+        # Right side is a pure constant k.
+        # (a*x + b) * k = (k*a)*x + (k*b)
+        return (right_constant * left_factor, right_constant * left_constant)
+
+
+def _collect_div(left_factor, left_constant, right_factor, right_constant, node):
+    # (a*x + b) / (c*x + d) is linear only when the divisor is a
+    # pure constant (c == 0).  Division BY the variable would make
+    # the expression non-linear (1/x term).
+    if right_factor != 0:
+        # Divisor contains the variable => non-linear (e.g. 1/x)
+        raise E.SolverError("Non-linear equation (Division by variable).", code="3006", position_start=node.position_start)
+    elif right_constant == 0:
+        # Division by zero in the constant divisor
+        raise E.SolverError("Solver: Division by zero", code="3003", position_start=node.position_start)
+    # Divisor is a non-zero constant k.
+    # (a*x + b) / k = (a/k)*x + (b/k)
+    return (left_factor / right_constant, left_constant / right_constant)
+
+
+def _collect_pow(left_factor, left_constant, right_factor, right_constant, node):
+    # Exponentiation is always non-linear for the solver
+    raise E.SolverError("Powers are not supported by the linear solver.", code="3007", position_start=node.position_start)
+
+
+def _collect_eq(left_factor, left_constant, right_factor, right_constant, node):
+    # The '=' is handled at the top level by the solver, not
+    # inside a recursive collect_term call.
+    raise E.SolverError("Should not happen: '=' inside collect_terms", code="3720", position_start=node.position_start)
+
+
+def _collect_unknown(left_factor, left_constant, right_factor, right_constant, node):
+    raise E.CalculationError(f"Unknown operator: {node.operator}", code="3004", position_start=node.position_start)
+
+
+# Maps operator strings to their linear-decomposition handler.  Bitwise
+# operators are deliberately absent: they fall through to the 3004 error.
+_COLLECT_OPS = {
+    '+': _collect_add,
+    '-': _collect_sub,
+    '*': _collect_mul,
+    '/': _collect_div,
+    '**': _collect_pow,
+    '=': _collect_eq,
+}
+
+
+# Small-int node kinds.  The iterative walkers (compile_tree and
+# BinOp.collect_term) branch on ``node.KIND`` -- a class attribute, so it
+# costs no per-instance memory.
+NUMBER = 0
+VARIABLE = 1
+BINOP = 2
+
+
 class Number:
     """AST node representing a numeric literal, backed by ``decimal.Decimal``.
 
@@ -34,22 +266,32 @@ class Number:
             in the source string (``-1`` when unknown).
     """
 
+    # No per-instance __dict__: parsed trees allocate one object per token
+    __slots__ = ('value', 'position_start', 'position_end')
+    KIND = NUMBER
+
     def __init__(self, value, position_start=-1, position_end=-1):
         """Create a Number node.
 
         Args:
-            value: Any numeric type.  Non-Decimal values are first
-                converted to ``str`` before being passed to the ``Decimal``
-                constructor so that floating-point artifacts (e.g.
-                ``Decimal(0.1)`` producing ``0.1000000000000000055...``)
-                are avoided.
+            value: Any numeric type.  ``Decimal`` values are stored as-is
+                (they are immutable) and plain ``int`` values are converted
+                exactly.  Other values are first converted to ``str``
+                before being passed to the ``Decimal`` constructor so that
+                floating-point artifacts (e.g. ``Decimal(0.1)`` producing
+                ``0.1000000000000000055...``) are avoided.
             position_start: Start index in the source string.
             position_end: End index in the source string.
         """
-        # Always normalize input to Decimal via string to avoid float artifacts
-        if not isinstance(value, Decimal):
-            value = str(value)
-        self.value = Decimal(value)
+        # Cheapest exact conversion first; anything else goes through str
+        # to avoid float artifacts
+        value_type = type(value)
+        if value_type is Decimal:
+            self.value = value
+        elif value_type is int:
+            self.value = Decimal(value)
+        else:
+            self.value = Decimal(value if isinstance(value, Decimal) else str(value))
         self.position_start = position_start
         self.position_end = position_end
 
@@ -81,6 +323,10 @@ class Number:
         # and its full value to the constant term.
         return (0, self.value)
 
+    def compile(self):
+        """Lower this literal to bytecode (see :func:`compile_tree`)."""
+        return compile_tree(self)
+
     def __repr__(self):
         """Return a human-readable representation, e.g. ``Number(3.14)``."""
         try:
@@ -90,6 +336,10 @@ class Number:
         return f"Number({display_value})"
 
 
+# Message for evaluating an unresolved variable; built once, not per raise.
+_NON_LINEAR_MESSAGE = "Non linear problem."
+
+
 class Variable:
     """AST node representing a single symbolic variable (e.g. ``"var0"``).
 
@@ -106,6 +356,9 @@ class Variable:
             in the source string (``-1`` when unknown).
     """
 
+    __slots__ = ('name', 'position_start', 'position_end')
+    KIND = VARIABLE
+
     def __init__(self, name, position_start=-1, position_end=-1):
         """Create a Variable node.
 
@@ -130,7 +383,7 @@ class Variable:
                 that a numeric evaluation path encountered an unresolved
                 variable.
         """
-        raise E.SolverError(f"Non linear problem.", code="3005", position_start=self.position_start)
+        raise E.SolverError(_NON_LINEAR_MESSAGE, code="3005", position_start=self.position_start)
 
     def collect_term(self, var_name):
         """Decompose this variable for the linear equation solver.
@@ -158,11 +411,33 @@ class Variable:
             # A second, different variable was encountered -- not solvable linearly
             raise E.SolverError(f"Multiple variables found: {self.name}", code="3002", position_start=self.position_start)
 
+    def compile(self):
+        """Lower this variable to bytecode (see :func:`compile_tree`)."""
+        return compile_tree(self)
+
     def __repr__(self):
         """Return a human-readable representation, e.g. ``Variable('var0')``."""
         return f"Variable('{self.name}')"
 
 
+# Operators whose folded result may stand in for the subtree in collect_term()
+_LINEAR_FOLD_OPS = frozenset(('+', '-', '*', '/'))
+
+
+def _constant_value(node):
+    """Return the constant value of a literal or folded BinOp, else None."""
+    if isinstance(node, Number):
+        return node.value
+    if isinstance(node, BinOp):
+        return node._folded
+    return None
+
+
+def _is_linear_constant(node):
+    """True for literals and folded BinOps built only from linear operators."""
+    return isinstance(node, Number) or (isinstance(node, BinOp) and node._linear_constant)
+
+
 class BinOp:
     """AST node for a binary operation: ``left <operator> right``.
 
@@ -176,6 +451,10 @@ class BinOp:
         position_end:   End index of the operator in the source string.
     """
 
+    __slots__ = ('left', 'operator', 'right', 'position_start', 'position_end',
+                 '_eval', '_collect', '_folded', '_linear_constant', '_compiled')
+    KIND = BINOP
+
     def __init__(self, left, operator, right, position_start=-1, position_end=-1):
         """Create a BinOp node.
 
@@ -185,12 +464,50 @@ class BinOp:
             right: Right-hand subtree (``Number``, ``Variable``, or ``BinOp``).
             position_start (int): Start index of the operator in the source.
             position_end (int): End index of the operator in the source.
+
+        Raises:
+            E.CalculationError: Unknown operator (code ``3004``).
         """
         self.left = left
-        self.operator = operator
+        # Interned so the operator-table lookups hit the identity fast path
+        self.operator = sys.intern(operator)
         self.right = right
         self.position_start = position_start
         self.position_end = position_end
+        # Lazily filled by compile(); the tree is never mutated after parsing
+        self._compiled = None
+
+        # The operator is fixed for the node's lifetime, so resolve its
+        # handlers once here instead of on every evaluation.
+        self._eval = _EVAL_OPS.get(operator)
+        if self._eval is None:
+            raise E.CalculationError(f"Unknown operator: {operator}", code="3004", position_start=position_start)
+        # Bitwise operators have no linear form and report 3004 when collected
+        self._collect = _COLLECT_OPS.get(operator, _collect_unknown)
+
+        # --- Constant folding ---
+        # ``constant <op> constant`` is computed once here; evaluate() then
+        # treats the node as a literal.  If folding fails (division by zero,
+        # non-integer bitwise operand, ...) the node stays unfolded so the
+        # error is raised at evaluation time exactly as before.
+        self._folded = None
+        left_value = _constant_value(left)
+        right_value = _constant_value(right)
+        if left_value is not None and right_value is not None and operator != '=':
+            try:
+                self._folded = self._eval(left_value, right_value, self)
+            except (E.MathError, ArithmeticError, ValueError, MemoryError):
+                self._folded = None
+
+        # collect_term() may only use the folded value if every node below is
+        # linear-safe: e.g. (2**3)+1 must still report "Powers are not
+        # supported" (3007) to the solver.
+        self._linear_constant = (
+            self._folded is not None
+            and operator in _LINEAR_FOLD_OPS
+            and _is_linear_constant(left)
+            and _is_linear_constant(right)
+        )
 
     def evaluate(self):
         """Recursively evaluate both subtrees and apply the binary operator.
@@ -208,60 +525,14 @@ class BinOp:
                 operands for bitwise ops (code ``3042``), or unknown operator
                 (code ``3004``).
         """
-        # Recursively evaluate both child subtrees first (post-order traversal)
-        left_value = self.left.evaluate()
-        right_value = self.right.evaluate()
-
-        def check_int(val_l, val_r):
-            """Guard: bitwise operators require both operands to be integers."""
-            if val_l % 1 != 0 or val_r % 1 != 0:
-                raise E.CalculationError(f"Operator '{self.operator}' requires integers.", code="3042", position_start=self.position_start)
-
-        # --- Arithmetic operators (Decimal -> Decimal) ---
-        if self.operator == '+':
-            return left_value + right_value
-
-        elif self.operator == '-':
-            return left_value - right_value
-
-        # --- Bitwise operators (int -> Decimal) ---
-        elif self.operator == '&':
-            check_int(left_value, right_value)
-            return Decimal(int(left_value) & int(right_value))
-
-        elif self.operator == '|':
-            check_int(left_value, right_value)
-            return Decimal(int(left_value) | int(right_value))
-
-        elif self.operator == '^':
-            check_int(left_value, right_value)
-            return Decimal(int(left_value) ^ int(right_value))
-
-        elif self.operator == '<<':
-            check_int(left_value, right_value)
-            return Decimal(int(left_value) << int(right_value))
-
-        elif self.operator == '>>':
-            check_int(left_value, right_value)
-            return Decimal(int(left_value) >> int(right_value))
-
-        # --- Multiplicative / power operators ---
-        elif self.operator == '*':
-            return left_value * right_value
-
-        elif self.operator == '**':
-            return left_value ** right_value
-
-        elif self.operator == '/':
-            if right_value == 0:
-                raise E.CalculationError("Division by zero", code="3003", position_start=self.position_start)
-            return left_value / right_value
-
-        # --- Equality (returns bool, not Decimal) ---
-        elif self.operator == '=':
-            return left_value == right_value
-        else:
-            raise E.CalculationError(f"Unknown operator: {self.operator}", code="3004", position_start=self.position_start)
+        # The tree is lowered once to postorder bytecode and executed on a
+        # stack machine: same left-then-right evaluation order as a
+        # recursive walk, but no Python call per node and no recursion limit.
+        if self._folded is not None:
+            # Whole tree is constant: the program would be one LOAD_CONST
+            return self._folded
+        code, consts, _ = self.compile()
+        return run(code, consts)
 
     def collect_term(self, var_name):
         """Collect linear terms on this subtree into ``(factor_of_var, constant)``.
@@ -295,70 +566,200 @@ class BinOp:
         # "constant" is the purely numeric part.
         #
         # Example:  the subtree (2*x + 3) yields (factor=2, constant=3).
-        (left_factor, left_constant) = self.left.collect_term(var_name)
-        (right_factor, right_constant) = self.right.collect_term(var_name)
-
-        # --- Addition: (a*x + b) + (c*x + d) = (a+c)*x + (b+d) ---
-        if self.operator == '+':
-            return (left_factor + right_factor, left_constant + right_constant)
-
-        # --- Subtraction: (a*x + b) - (c*x + d) = (a-c)*x + (b-d) ---
-        elif self.operator == '-':
-            return (left_factor - right_factor, left_constant - right_constant)
-
-        # --- Multiplication ---
-        # (a*x + b) * (c*x + d) is linear ONLY when at most one side
-        # contains the variable.  If both sides have a non-zero factor
-        # the product introduces an x^2 term, which is non-linear.
-        elif self.operator == '*':
-            if left_factor != 0 and right_factor != 0:
-                # Both sides depend on x  =>  x * x = x^2  =>  non-linear
-                raise E.SyntaxError("x^x Error (Non-linear).", code="3005", position_start=self.position_start)
-
-            elif left_factor == 0:
-                # Left side is a pure constant k.
-                # k * (c*x + d) = (k*c)*x + (k*d)
-                return (left_constant * right_factor, left_constant * right_constant)
-
-            elif right_factor == 0:
-                # Right side is a pure constant k.
-                # (a*x + b) * k = (k*a)*x + (k*b)
-                return (right_constant * left_factor, right_constant * left_constant)
-
-            elif left_factor == 0 and right_factor == 0:
-                # Both sides are pure constants (no variable at all).
-                # 0*x + b * 0*x + d = 0*x + b*d
-                return (0, right_constant * left_constant)
-
-        # --- Division ---
-        # (a*x + b) / (c*x + d) is linear only when the divisor is a
-        # pure constant (c == 0).  Division BY the variable would make
-        # the expression non-linear (1/x term).
-        elif self.operator == '/':
-            if right_factor != 0:
-                # Divisor contains the variable => non-linear (e.g. 1/x)
-                raise E.SolverError("Non-linear equation (Division by variable).", code="3006", position_start=self.position_start)
-            elif right_constant == 0:
-                # Division by zero in the constant divisor
-                raise E.SolverError("Solver: Division by zero", code="3003", position_start=self.position_start)
+        if self._linear_constant:
+            # Folded constant subtree: no variable part
+            return (0, self._folded)
+
+        # Post-order walk with an explicit stack: long sums such as
+        # x+x+...+x nest deeper than the recursion limit.  The left operand
+        # is finished before the right one is started, so the first error
+        # raised is the same as in a recursive walk.
+        results = []
+        pending = [(self, False)]
+        while pending:
+            node, children_done = pending.pop()
+            if children_done:
+                (right_factor, right_constant) = results.pop()
+                (left_factor, left_constant) = results.pop()
+                results.append(node._collect(left_factor, left_constant, right_factor, right_constant, node))
+            elif node.KIND != BINOP:
+                results.append(node.collect_term(var_name))
+            elif node._linear_constant:
+                results.append((0, node._folded))
             else:
-                # Divisor is a non-zero constant k.
-                # (a*x + b) / k = (a/k)*x + (b/k)
-                return (left_factor / right_constant, left_constant / right_constant)
-
-        # --- Exponentiation: always non-linear for the solver ---
-        elif self.operator == '**':
-            raise E.SolverError("Powers are not supported by the linear solver.", code="3007", position_start=self.position_start)
+                pending.append((node, True))
+                pending.append((node.right, False))
+                pending.append((node.left, False))
+        return results.pop()
 
-        # --- Equality inside a subtree should never occur ---
-        # The '=' is handled at the top level by the solver, not
-        # inside a recursive collect_term call.
-        elif self.operator == '=':
-            raise E.SolverError("Should not happen: '=' inside collect_terms", code="3720", position_start=self.position_start)
+    def compile(self):
+        """Lower this subtree to bytecode, caching the result on the node.
 
-        else:
-            raise E.CalculationError(f"Unknown operator: {self.operator}", code="3004", position_start=self.position_start)
+        Returns:
+            tuple: ``(code, consts, names)`` as produced by :func:`compile_tree`.
+        """
+        if self._compiled is None:
+            self._compiled = compile_tree(self)
+        return self._compiled
 
     def __repr__(self):
         """Return a human-readable representation of the BinOp tree."""
-        return f"BinOp({self.operator!r}, left={self.left}, right={self.right})"
\ No newline at end of file
+        return f"BinOp({self.operator!r}, left={self.left}, right={self.right})"
+
+
+def _as_number(node):
+    """``Number`` carrying the folded value and position of a BinOp."""
+    return Number(node._folded, position_start=node.position_start, position_end=node.position_end)
+
+
+def prune_constants(root):
+    """Replace constant-folded subtrees by ``Number`` leaves.
+
+    Every ``BinOp`` whose value was folded at construction is swapped for a
+    ``Number`` holding that value, so later walks see a smaller tree.
+    Meant for trees without variables: the linear solver walks constant
+    subtrees operator by operator, and its results (including the Decimal
+    exponent of the solution) depend on that structure.  Nodes are updated
+    in place; the walk is iterative.
+
+    Args:
+        root: The AST root (``Number``, ``Variable``, or ``BinOp``).
+
+    Returns:
+        The new root (a ``Number`` if the whole tree was constant).
+    """
+    if root.KIND != BINOP:
+        return root
+    if root._folded is not None:
+        return _as_number(root)
+
+    pending = [root]
+    while pending:
+        node = pending.pop()
+        left = node.left
+        if left.KIND == BINOP:
+            if left._folded is not None:
+                node.left = _as_number(left)
+            else:
+                pending.append(left)
+        right = node.right
+        if right.KIND == BINOP:
+            if right._folded is not None:
+                node.right = _as_number(right)
+            else:
+                pending.append(right)
+    return root
+
+# ---------------------------------------------------------------------------
+# Bytecode compiler and stack machine
+# ---------------------------------------------------------------------------
+# The bytecode is a flat list of ints, alternating ``opcode, operand_index``.
+# ``operand_index`` points into the ``consts`` table, which holds:
+#   - the Decimal value for LOAD_CONST,
+#   - the Variable node for LOAD_VAR (name + position for error messages),
+#   - the BinOp node for every operator opcode (position for error messages).
+
+LOAD_CONST = 0
+LOAD_VAR = 1
+OP_UNKNOWN = 2
+
+# Operator opcodes start after the load/unknown opcodes.  The handler tuple is
+# indexed directly by opcode, so the order here defines the numbering.
+_OPERATOR_ORDER = ('+', '-', '*', '/', '**', '=', '&', '|', '^', '<<', '>>')
+OPCODES = {operator: index + 3 for index, operator in enumerate(_OPERATOR_ORDER)}
+
+
+def _eval_unknown(left_value, right_value, node):
+    raise E.CalculationError(f"Unknown operator: {node.operator}", code="3004", position_start=node.position_start)
+
+
+_OPCODE_HANDLERS = (None, None, _eval_unknown) + tuple(_EVAL_OPS[operator] for operator in _OPERATOR_ORDER)
+
+
+def compile_tree(root):
+    """Lower an AST to flat postorder bytecode.
+
+    The traversal uses an explicit stack, so arbitrarily deep trees (e.g. a
+    long chain ``1+1+1+...``) compile without hitting the recursion limit.
+
+    Args:
+        root: The AST root (``Number``, ``Variable``, or ``BinOp``).
+
+    Returns:
+        tuple: ``(code, consts, names)`` where ``code`` is the flat
+        ``[opcode, operand_index, ...]`` list, ``consts`` the operand table
+        and ``names`` the distinct variable names in order of appearance.
+    """
+    code = []
+    consts = []
+    names = []
+    pending = [(root, False)]
+
+    while pending:
+        node, children_done = pending.pop()
+        kind = node.KIND
+
+        if kind == NUMBER:
+            code += (LOAD_CONST, len(consts))
+            consts.append(node.value)
+
+        elif kind == VARIABLE:
+            code += (LOAD_VAR, len(consts))
+            consts.append(node)
+            if node.name not in names:
+                names.append(node.name)
+
+        elif node._folded is not None:
+            # Constant subtree folded at construction time
+            code += (LOAD_CONST, len(consts))
+            consts.append(node._folded)
+
+        elif children_done:
+            code += (OPCODES.get(node.operator, OP_UNKNOWN), len(consts))
+            consts.append(node)
+
+        else:
+            # Postorder: left, right, then the operator itself
+            pending.append((node, True))
+            pending.append((node.right, False))
+            pending.append((node.left, False))
+
+    return code, consts, names
+
+
+def run(code, consts, env=None):
+    """Execute bytecode produced by :func:`compile_tree`.
+
+    Args:
+        code (list[int]): Flat ``[opcode, operand_index, ...]`` list.
+        consts (list): Operand table belonging to ``code``.
+        env (dict, optional): Maps variable names to values.  Without a
+            binding, a variable raises exactly like ``Variable.evaluate()``.
+
+    Returns:
+        Decimal or bool: The computed result.
+
+    Raises:
+        E.CalculationError: Same conditions as ``BinOp.evaluate()``.
+        E.SolverError: Unbound variable (code ``3005``).
+    """
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    handlers = _OPCODE_HANDLERS
+
+    instructions = iter(code)
+    for opcode, operand_index in zip(instructions, instructions):
+        operand = consts[operand_index]
+        if opcode == LOAD_CONST:
+            push(operand)
+        elif opcode == LOAD_VAR:
+            if env is None or operand.name not in env:
+                operand.evaluate()  # raises SolverError 3005
+            push(env[operand.name])
+        else:
+            right_value = pop()
+            left_value = pop()
+            push(handlers[opcode](left_value, right_value, operand))
+
+    return pop()
@@ -6,5 +6,6 @@ Contains the core computation modules:
 - :mod:`calculator`       — tokenizer, parser, solver, formatter, ``calculate()``
 - :mod:`AST_Node_Types`   — AST node classes (Number, Variable, BinOp)
 - :mod:`ScientificEngine` — scientific function evaluators (sin, cos, log, etc.)
+- :mod:`float_compiler`   — opt-in float64/JIT compilation of expression trees
 - :mod:`translator`       — standalone tokenizer (earlier version, currently unused)
 """
\ No newline at end of file
@@ -30,17 +30,24 @@ Public entry point
 :func:`calculate`
 """
 
-from decimal import Decimal, getcontext, Overflow, DivisionImpossible, InvalidOperation
+from decimal import Decimal, getcontext, localcontext, Overflow, DivisionImpossible, InvalidOperation
 import fractions
+from collections import OrderedDict, deque
+from functools import lru_cache
 from typing import Union
+import logging
 import re
-from ..utility.utility import boolean, isInt, isfloat, isScOp, isOp
+import sys
+from ..utility.utility import boolean, isInt, isfloat, isScOp
 from math_engine import config_manager as config_manager
 from . import ScientificEngine
 from ..utility import error as E
+from ..utility import plugin_manager
 from ..utility.plugin_manager import function_register
 from ..utility.non_decimal_utility import int_to_value, value_to_int, non_decimal_scan, apply_word_limit, setbit, bitor, bitand, bitnot, bitxor, shl, shr, clrbit, togbit, testbit
-from .AST_Node_Types import Number, BinOp, Variable
+from .AST_Node_Types import Number, BinOp, Variable, prune_constants, _is_integral
+
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Module-level constants and configuration
@@ -53,18 +60,87 @@ debug = False
 # Supported operators (used for membership checks in the tokenizer and parser).
 Operations = ["+", "-", "*", "/", "=", "^", ">>", "<<", "<", ">", "|","&" ]
 
+# Single characters that start an operator token.  Checked per character by
+# the tokenizer, so a set lookup instead of ``isOp()``'s ``list.index`` probe.
+OPERATOR_CHARS = frozenset(op for op in Operations if len(op) == 1)
+
 # Built-in scientific function names recognized by the tokenizer.
 Science_Operations = ["sin", "cos", "tan", "10^x", "log", "e^", "π", "√"]
 
 # Built-in bit manipulation function names recognized by the tokenizer.
 Bit_Operations = ["setbit", "bitxor", "shl", "shr", "bitnot", "bitand", "bitor", "clrbit", "togbit", "testbit"]
 
+# Hashed twins of the lists above for per-token membership tests; the lists
+# stay for isOp()/isScOp(), which need the index.
+OPERATIONS_SET = frozenset(Operations)
+SCIENCE_OPERATIONS_SET = frozenset(Science_Operations)
+BIT_OPERATIONS_SET = frozenset(Bit_Operations)
+
+# Two-argument bit functions, dispatched by name from parse_factor.
+_BIT_FUNCS2 = {
+    "setbit": setbit,
+    "bitxor": bitxor,
+    "clrbit": clrbit,
+    "togbit": togbit,
+    "testbit": testbit,
+    "shl": shl,
+    "shr": shr,
+    "bitand": bitand,
+    "bitor": bitor,
+}
+
+# Bit functions whose internal errors surface as CalculationError 3041
+# instead of SyntaxError 8007.
+_BIT_CALCULATION_ERRORS = frozenset(("shl", "shr", "bitand", "bitor"))
+
+# Output type prefixes accepted in front of an expression (e.g. "hex:255"),
+# mapped to their canonical form.  ASCII-only case folding matches the
+# historical ``problem.lower().startswith(...)`` check.  A bare "bo" is
+# accepted without a colon and selects boolean output.
+OUTPUT_PREFIX_ALIASES = {
+    "dec": "decimal:", "d": "decimal:",
+    "int": "int:", "i": "int:", "integer": "int:",
+    "float": "float:", "f": "float:",
+    "bool": "boolean:", "boolean": "boolean:",
+    "hex": "hexadecimal:", "h": "hexadecimal:", "hexadecimal": "hexadecimal:",
+    "str": "string:", "s": "string:", "string": "string:",
+    "bin": "binary:", "bi": "binary:", "binary": "binary:",
+    "oc": "octal:", "o": "octal:", "octal": "octal:",
+}
+OUTPUT_PREFIX_RE = re.compile(
+    r"(?:(" + "|".join(sorted(OUTPUT_PREFIX_ALIASES, key=len, reverse=True)) + r"):|bo)",
+    re.IGNORECASE | re.ASCII,
+)
+
 # Functions registered by plugins at runtime (populated by plugin_manager).
 plugin_operations = []
 
-# Global Decimal precision ceiling.  Dynamically adjusted per-calculation in
-# ``calculate()`` based on input size and the ``decimal_places`` setting.
-getcontext().prec = 10000
+# --- Decimal precision policy ---
+# ``calculate()`` runs every request in its own decimal context whose
+# precision is derived from the input size and the ``decimal_places`` setting
+# (see ``calculate()``), so the caller's thread context is never modified.
+MIN_PRECISION = 100       # Precision floor; adjustable via set_min_precision()
+SAFETY_BUFFER = 50        # Extra digits on top of the longest input / target
+MAX_PRECISION = 10000     # Hard ceiling for the per-call precision
+MAX_DIGIT_LIMIT = 20000   # Longest accepted numeric literal in the input
+
+
+def set_min_precision(precision):
+    """Set the minimum Decimal precision used by :func:`calculate`.
+
+    Lower values make evaluation of short expressions cheaper; the effective
+    precision still grows with the input size and ``decimal_places``.
+
+    Args:
+        precision (int): Number of significant digits (``1`` .. ``MAX_PRECISION``).
+
+    Raises:
+        E.ConfigError: If *precision* is not an integer in range (code ``5004``).
+    """
+    global MIN_PRECISION
+    if isinstance(precision, bool) or not isinstance(precision, int) or not 1 <= precision <= MAX_PRECISION:
+        raise E.ConfigError(f"Precision must be a whole number between 1 and {MAX_PRECISION}.", code="5004")
+    MIN_PRECISION = precision
 
 
 
@@ -117,9 +193,87 @@ FUNCTION_STARTS_OPTIMIZED = {
 }
 
 
+class _FuncTrie:
+    """Prefix trie over the function/constant prefixes.
+
+    Nodes are dicts ``{char: child}``; the key ``None`` marks a terminal and
+    holds ``(token, length)``.  A lookup walks the input once from the start
+    position, so its cost depends on the prefix length, not on how many
+    functions (including plugins) are registered.
+    """
+
+    __slots__ = ("root",)
+
+    def __init__(self, starts):
+        self.root = {}
+        for start_str, terminal in starts.items():
+            node = self.root
+            for char in start_str:
+                node = node.setdefault(char, {})
+            node[None] = terminal
+
+    def longest_match(self, text, start):
+        """Return ``(token, length)`` of the longest prefix of ``text`` at
+        ``start``, or ``None`` if no prefix matches.
+        """
+        node = self.root.get(text[start])
+        if node is None:
+            return None
+        best = node.get(None)
+        index = start + 1
+        end = len(text)
+        while index < end:
+            node = node.get(text[index])
+            if node is None:
+                break
+            index += 1
+            terminal = node.get(None)
+            if terminal is not None:
+                best = terminal
+        return best
+
+
+# Longest-match automaton used by the tokenizer's function detection.
+FUNCTION_TRIE = _FuncTrie(FUNCTION_STARTS_OPTIMIZED)
+
+# The tail of a decimal literal: digits, '.', 'e'/'E', and a sign directly
+# after 'e'/'E'.  Malformed runs (two '.', two 'e') are reported afterwards.
+NUMBER_TAIL_RE = re.compile(r"(?:[\d.eE]|(?<=[eE])[+-])*")
+
+# The characters inside a literal that may occur at most once each.
+NUMBER_MARKER_RE = re.compile(r"[.eE]")
+
+# Runs of blanks are skipped in one step.
+SPACES_RE = re.compile(r" +")
+
+# Numeric literals in the raw input; only their lengths are used, to size the
+# Decimal precision in calculate().
+INPUT_NUMBER_RE = re.compile(r"\d+(?:\.\d+)?")
+
+# Prefixes of the literals handled by non_decimal_scan().
+NON_DECIMAL_PREFIXES = ("0b", "0B", "0x", "0X", "0o", "0O")
+
+# Characters that start a bare hex literal (``only_hex`` mode), and a run of them.
+HEX_DIGITS = frozenset("0123456789ABCDEFabcdef")
+HEX_RUN_RE = re.compile(r"[0-9A-Fa-f]+")
+
+# Shared Decimal tokens for small integer literals, keyed by their exact
+# source text and by int (the non-decimal modes convert before the lookup).
+# Decimals are immutable, and a dict hit is several times cheaper than the
+# Decimal string parser.  "2.0" and friends are not here: they keep their
+# exponent, which shows in the formatted result.
+_SMALL_DECIMALS = {}
+for _small_int in range(257):
+    _SMALL_DECIMALS[str(_small_int)] = _SMALL_DECIMALS[_small_int] = Decimal(_small_int)
+del _small_int
+
+# An identifier: ``\w`` is exactly ``str.isalnum()`` plus ``'_'``.
+IDENTIFIER_RE = re.compile(r"\w*")
+
+
 def update_function_globals():
-    """Rebuild ``PURE_FUNCTION_NAMES`` and ``FUNCTION_STARTS_OPTIMIZED`` from
-    ``RAW_FUNCTION_MAP``.
+    """Rebuild ``PURE_FUNCTION_NAMES``, ``FUNCTION_STARTS_OPTIMIZED`` and
+    ``FUNCTION_TRIE`` from ``RAW_FUNCTION_MAP``.
 
     Called after a plugin registers a new function to ensure the tokenizer
     recognizes the newly added function name.
@@ -127,6 +281,7 @@ def update_function_globals():
     global RAW_FUNCTION_MAP
     global PURE_FUNCTION_NAMES
     global FUNCTION_STARTS_OPTIMIZED
+    global FUNCTION_TRIE
 
     PURE_FUNCTION_NAMES.clear()
     for start_str, token in RAW_FUNCTION_MAP.items():
@@ -137,6 +292,138 @@ def update_function_globals():
     for start_str, token in RAW_FUNCTION_MAP.items():
         FUNCTION_STARTS_OPTIMIZED[start_str] = (token, len(start_str))
 
+    FUNCTION_TRIE = _FuncTrie(FUNCTION_STARTS_OPTIMIZED)
+    _ast_cache.clear()
+    _token_cache.clear()
+
+
+def _sync_plugin_functions():
+    """Hot-register any pending plugin function into the tokenizer maps."""
+    global RAW_FUNCTION_MAP
+    global plugin_operations
+    global _synced_plugin_version
+
+    # The plugin_manager stores newly registered callables in ``function_register``
+    # and bumps its version counter; while the version is unchanged there is
+    # nothing to do.  Otherwise new entries are injected into RAW_FUNCTION_MAP
+    # and the optimized lookup tables are rebuilt so subsequent tokenization
+    # recognizes the function names.
+    if plugin_manager._plugin_version == _synced_plugin_version:
+        return
+    _synced_plugin_version = plugin_manager._plugin_version
+
+    added = False
+    for function_name_key in function_register:
+        if function_name_key not in RAW_FUNCTION_MAP:
+            function_name_pure = function_name_key.rstrip("(")
+            RAW_FUNCTION_MAP[function_name_key] = function_name_pure
+            plugin_operations.append(function_name_pure)
+            added = True
+
+    if added:
+        # Rebuild PURE_FUNCTION_NAMES and FUNCTION_STARTS_OPTIMIZED
+        update_function_globals()
+        logger.debug("Function tables updated after plugin registration.")
+
+
+# ``plugin_manager._plugin_version`` last handled by _sync_plugin_functions()
+_synced_plugin_version = 0
+
+
+# --- Parse cache ---
+# Results of :func:`ast` for recently seen inputs, oldest first.  The key
+# covers everything that influences parsing (see ``_ast_cache_key``); the
+# cache is cleared whenever the function tables change.
+AST_CACHE_SIZE = 1024
+_ast_cache = OrderedDict()
+
+# Token lists from :func:`translator`, same keys and size as the parse cache.
+_token_cache = OrderedDict()
+
+
+def _ast_cache_key(problem, settings, custom_variables):
+    """Build the parse-cache key, or ``None`` if an input is unhashable.
+
+    Variable values are keyed by type and ``str()`` form, which is exact
+    for ``int``, ``float`` and ``Decimal``.  The sin/cos/tan degree mode
+    and the Decimal precision are included because function calls and
+    constant subtrees are already evaluated while parsing.
+    """
+    try:
+        return (
+            problem,
+            frozenset(settings.items()),
+            frozenset((name, type(value), str(value)) for name, value in custom_variables.items()),
+            ScientificEngine.degree_setting_sincostan,
+            getcontext().prec,
+        )
+    except TypeError:
+        return None
+
+
+def cached_ast(problem, settings, custom_variables):
+    """Return :func:`ast` results, reusing the parse of an identical input.
+
+    Repeated evaluations of the same expression (loops, plotting) skip
+    tokenizing and parsing entirely.  Errors are not cached, and the cache
+    is bypassed in debug mode so token dumps are still printed.
+
+    Returns:
+        tuple: ``(final_tree, cas, var_counter, expected_bool)`` as from
+        :func:`ast`.  The tree is shared between calls and must not be
+        modified.
+    """
+    _sync_plugin_functions()
+    key = None if debug else _ast_cache_key(problem, settings, custom_variables)
+    if key is not None:
+        parsed = _ast_cache.get(key)
+        if parsed is not None:
+            _ast_cache.move_to_end(key)
+            return parsed
+
+    parsed = ast(problem, settings, custom_variables)
+    if key is not None:
+        _ast_cache[key] = parsed
+        if len(_ast_cache) > AST_CACHE_SIZE:
+            _ast_cache.popitem(last=False)
+    return parsed
+
+
+def cached_translator(problem, custom_variables, settings):
+    """Return :func:`translator` results, reusing the scan of an identical input.
+
+    Keyed like the parse cache (see ``_ast_cache_key``).  It serves the
+    callers that tokenize without going through :func:`cached_ast`, and
+    parse attempts that failed after tokenizing.  Errors are not cached and
+    debug mode bypasses the cache.
+
+    Returns:
+        tuple: ``(full_problem, var_counter, token_spans)`` as from
+        :func:`translator`; both lists are fresh copies the caller may modify.
+    """
+    _sync_plugin_functions()
+    key = None if debug else _ast_cache_key(problem, settings, custom_variables)
+    if key is not None:
+        scanned = _token_cache.get(key)
+        if scanned is not None:
+            _token_cache.move_to_end(key)
+            tokens, var_counter, token_spans = scanned
+            return list(tokens), var_counter, list(token_spans)
+
+    full_problem, var_counter, token_spans = translator(problem, custom_variables, settings)
+    if key is not None:
+        _token_cache[key] = (tuple(full_problem), var_counter, tuple(token_spans))
+        if len(_token_cache) > AST_CACHE_SIZE:
+            _token_cache.popitem(last=False)
+    return full_problem, var_counter, token_spans
+
+
+def clear_parse_cache():
+    """Drop all cached parse results and memoized function values."""
+    _ast_cache.clear()
+    _token_cache.clear()
+    _scientific_value.cache_clear()
+
 
 def translator(problem, custom_variables, settings):
     """Tokenize a raw mathematical expression into a flat token list.
@@ -190,76 +477,51 @@ def translator(problem, custom_variables, settings):
         E.SyntaxError: On malformed input (double decimal point, unknown
             character, bare function name without parentheses, etc.).
     """
-    global RAW_FUNCTION_MAP
-    global plugin_operations
-
-    # --- Hot-register any pending plugin function into the tokenizer maps ---
-    # The plugin_manager stores newly registered callables in ``function_register``.
-    # On the first call that sees a new entry we inject it into RAW_FUNCTION_MAP
-    # and rebuild the optimized lookup tables so subsequent tokenization
-    # recognizes the function name.
-    if function_register:
-        function_name_key = list(function_register.keys())[0]
-        function_name_pure = function_name_key.rstrip("(")
-
-        if function_name_key not in RAW_FUNCTION_MAP:
-            RAW_FUNCTION_MAP[function_name_key] = function_name_pure
-            plugin_operations.append(function_name_pure)
+    _sync_plugin_functions()
 
-            # Rebuild PURE_FUNCTION_NAMES and FUNCTION_STARTS_OPTIMIZED
-            update_function_globals()
-            print("Globale Funktionsregister nach Plugin-Registrierung aktualisiert.")
     # --- Tokenizer state initialisation ---
     var_counter = 0
-    var_list = [None] * len(problem)  # Track seen variable symbols -> var0, var1, ...
+    var_index = {}          # Seen variable symbols -> index (var0, var1, ...)
     full_problem = []       # Accumulated output tokens
     token_spans = []        # Parallel position spans for error reporting
     b = 0                   # Current scan position in the input string
 
-    # Build a string-valued copy of custom_variables for inline substitution.
-    CONTEXT_VARS = {}
-    for var_name, value in custom_variables.items():
-        if isinstance(value, (int, float, Decimal)):
-            CONTEXT_VARS[var_name] = str(value)
-        elif isinstance(value, bool):
-            CONTEXT_VARS[var_name] = "1" if value else "0"
-        else:
-            CONTEXT_VARS[var_name] = str(value)
-
-    # Sort variable names longest-first so that e.g. "ab" is matched before "a".
-    sorted_vars = sorted(CONTEXT_VARS.keys(), key=len, reverse=True)
-    HEX_DIGITS = "0123456789ABCDEFabcdef"
-    temp_problem = problem
-    # for var_name in sorted_vars:
-    #     value_str = CONTEXT_VARS[var_name]
-    #     value_str = value_str
-    #     temp_problem = temp_problem.replace(var_name, value_str)
+    # Settings read in the scanning loop, looked up once
+    only_hex = settings.get("only_hex", False) == True
+    only_binary = settings.get("only_binary", False) == True
+    only_octal = settings.get("only_octal", False) == True
+    non_decimal = only_hex or only_binary or only_octal
 
-    problem = temp_problem
+    # Current after the plugin sync above
+    function_trie = FUNCTION_TRIE
+    function_first_chars = function_trie.root
 
     # --- Main character-by-character scanning loop ---
     # Each iteration classifies the character(s) at position ``b`` into exactly
     # one token category (function, number, operator, paren, constant, or
     # variable) and advances ``b`` past the consumed characters.
-    temp_var = -1
     while b < len(problem):
         found_function = False
         current_char = problem[b]
 
         # Phase 1: Try to match a known function / constant prefix at this position.
-        for start_str, (token, length) in FUNCTION_STARTS_OPTIMIZED.items():
-            if problem.startswith(start_str, b):
-                full_problem.append(token)
-                token_spans.append((b, b+len(token)-1, token))
-                if token != "π" and token != "E" and token != "e":
-                    full_problem.append("(")
-                    token_spans.append((b+len(token), b+len(token), "("))
-
-                b += length - 0
-                found_function = True
-                break
+        # Most characters cannot start one; skip the trie walk for them.
+        if current_char in function_first_chars:
+            function_match = function_trie.longest_match(problem, b)
+        else:
+            function_match = None
+        if function_match is not None:
+            token, length = function_match
+            full_problem.append(token)
+            token_spans.append((b, b+len(token)-1, token))
+            if token != "π" and token != "E" and token != "e":
+                full_problem.append("(")
+                token_spans.append((b+len(token), b+len(token), "("))
+
+            b += length
+            found_function = True
         if found_function:
-            if settings["only_hex"] == True or settings["only_binary"] == True or settings["only_octal"]== True:
+            if non_decimal:
                 raise E.SyntaxError(f"Function not support with only not decimals.", code="3033")
             continue
 
@@ -267,9 +529,14 @@ def translator(problem, custom_variables, settings):
         # First attempts a non-decimal scan (0x, 0b, 0o prefixes).  If that
         # fails, falls back to standard decimal/scientific-notation parsing
         # which handles digits, decimal points, and 'E'/'e' exponents.
-        if isInt(current_char) or (b >= 0 and current_char == "."):
+        if current_char.isdecimal() or current_char == ".":
             start_index = b
-            parsed_value, new_index = non_decimal_scan(problem, b, settings)
+            # non_decimal_scan() only acts on a 0b/0x/0o prefix; skip the call
+            # for every other number
+            if problem.startswith(NON_DECIMAL_PREFIXES, b):
+                parsed_value, new_index = non_decimal_scan(problem, b, settings)
+            else:
+                parsed_value = None
 
             if parsed_value is not None:
                 original_str = problem[start_index:new_index]
@@ -279,53 +546,37 @@ def translator(problem, custom_variables, settings):
 
             else:
 
-                str_number = current_char
-                has_decimal_point = (current_char == '.')
+                # Grab the whole literal in one regex call, then report the
+                # first malformed character (second '.' or second 'e'/'E').
+                end_index = NUMBER_TAIL_RE.match(problem, b + 1).end()
+                str_number = problem[b:end_index]
+                has_decimal_point = False
                 has_exponent_e = False
-
-                while (b + 1 < len(problem)):
-                    next_char = problem[b + 1]
-
-                    # 1. Handle decimal points
-                    if next_char == ".":
-                        if has_decimal_point:
-                            raise E.SyntaxError(f"Double decimal point.", code="3008", position_start=b + 1)
-                        has_decimal_point = True
-
-                    # 2. Handle the 'E' or 'e' for exponent
-                    elif next_char in ('e', 'E'):
-                        if temp_var == b and b > 0:
-                            raise E.SyntaxError(f"Multiple digit variables not supported.",
-                                                code="3032", position_start=b + 1)
-                        if has_exponent_e:
-                            # Cannot have two 'e's in a single number
-                            raise E.SyntaxError("Double exponent sign 'E'/'e'.", code="3031", position_start=b + 1)
-                        has_exponent_e = True
-
-                    # 3. Handle the sign (+ or -) immediately following 'E'/'e'
-                    elif next_char in ('+', '-'):
-                        # The sign is only valid if it immediately follows 'e' or 'E'
-                        if not (problem[b] in ('e', 'E') and has_exponent_e):
-                            break
-
-                    # 4. End the loop if the next character is not a number component
-                    elif not isInt(next_char):
-                        break
-
-                    # If we made it here, the character is a valid part of the number
-                    b += 1
-                    str_number += problem[b]
+                # Plain digit runs (the common case) have no markers to check
+                if not str_number.isdecimal():
+                    for marker in NUMBER_MARKER_RE.finditer(str_number):
+                        if marker.group() == ".":
+                            if has_decimal_point:
+                                raise E.SyntaxError(f"Double decimal point.", code="3008", position_start=b + marker.start())
+                            has_decimal_point = True
+                        else:
+                            if has_exponent_e:
+                                # Cannot have two 'e's in a single number
+                                raise E.SyntaxError("Double exponent sign 'E'/'e'.", code="3031", position_start=b + marker.start())
+                            has_exponent_e = True
+                b = end_index - 1
 
                 # Validate the final collected string
                 if isfloat(str_number) or isInt(str_number):
-                    if settings["only_hex"] == True:
+                    if only_hex:
                         str_number = value_to_int("0x"+str_number)
-                    elif settings["only_binary"] == True:
+                    elif only_binary:
                         str_number = value_to_int("0b"+str_number)
-                    elif settings["only_octal"] == True:
+                    elif only_octal:
                         str_number = value_to_int("0O"+str_number)
                     token_spans.append((start_index, b, str_number))
-                    full_problem.append(Decimal(str_number))
+                    value = _SMALL_DECIMALS.get(str_number)
+                    full_problem.append(Decimal(str_number) if value is None else value)
                 else:
                     if has_exponent_e and not str_number[-1].isdigit():
                         raise E.SyntaxError("Missing exponent value after 'E'/'e'.", code="3032", position_start=b)
@@ -333,7 +584,7 @@ def translator(problem, custom_variables, settings):
         # --- Phase 3: Operator recognition ---
         # Handles single-char ops (+, -, *, /, =, ^, |, &) and two-char
         # compound ops (**, <<, >>).  Invalid combos like <> or >< raise errors.
-        elif isOp(current_char) != -1:
+        elif current_char in OPERATOR_CHARS:
             start_index = b
             if current_char == "*" and b + 1 < len(problem) and problem[b + 1] == "*":
                 full_problem.append("**")
@@ -368,7 +619,7 @@ def translator(problem, custom_variables, settings):
 
         # --- Whitespace (ignored) ---
         elif current_char == " ":
-            pass
+            b = SPACES_RE.match(problem, b).end() - 1
 
         # --- Parentheses ---
         elif current_char == "(":
@@ -390,29 +641,29 @@ def translator(problem, custom_variables, settings):
         # When ``only_hex`` is active, characters A-F (case-insensitive) that
         # were not already consumed as part of a numeric literal are gathered
         # here and interpreted as hexadecimal digits.
-        elif settings.get("only_hex", False) and current_char in HEX_DIGITS:
-            str_number = current_char
+        elif only_hex and current_char in HEX_DIGITS:
             start_index = b
-            while b + 1 < len(problem) and problem[b + 1] in HEX_DIGITS:
-                b += 1
-                str_number += problem[b]
+            b = HEX_RUN_RE.match(problem, b).end() - 1
+            str_number = problem[start_index:b + 1]
 
             # Jetzt "0x" davorsetzen und in int -> Decimal umwandeln
             try:
                 int_value = value_to_int("0x" + str_number)
-                full_problem.append(Decimal(int_value))
+                value = _SMALL_DECIMALS.get(int_value)
+                full_problem.append(Decimal(int_value) if value is None else value)
                 token_spans.append((start_index, b, str_number))
             except E.ConversionError as e:
                 raise
 
         # --- Phase 5: Pi constant (Unicode glyph) ---
         elif current_char == 'π':
-            if settings["only_hex"] == True or settings["only_binary"] == True or settings["only_octal"]== True:
+            if non_decimal:
                 raise E.SyntaxError(f"Error with constant π:{result_string}", code="3033", position_start=b)
             result_string = ScientificEngine.isPi(str(current_char))
             try:
                 calculated_value = Decimal(result_string)
                 full_problem.append(calculated_value)
+                token_spans.append((b, b, current_char))
             except ValueError:
                 raise E.CalculationError(f"Error with constant π:{result_string}", code="3219", position_start=b)
 
@@ -424,14 +675,8 @@ def translator(problem, custom_variables, settings):
                 # the equation solver.
         else:
                 start_index = b
-                var_name = ""
-                while b < len(problem):
-                    char = problem[b]
-                    if char.isalnum() or char == '_':
-                        var_name += char
-                        b += 1
-                    else:
-                        break
+                b = IDENTIFIER_RE.match(problem, b).end()
+                var_name = problem[start_index:b]
 
                 if len(var_name) == 0:
                     raise E.SyntaxError(f"Unexpected token: {current_char}", code="3012", position_start=b)
@@ -460,16 +705,12 @@ def translator(problem, custom_variables, settings):
                         raise E.SyntaxError(f"Unknown function or variable too long: '{var_name}'", code="3011",
                                             position_start=start_index, position_end=b)
 
-                    if var_name in var_list:
-                        idx = var_list.index(var_name)
-                        full_problem.append("var" + str(idx))
-                    else:
-                        full_problem.append("var" + str(var_counter))
-                        if var_counter >= len(var_list):
-                            var_list.append(var_name)
-                        else:
-                            var_list[var_counter] = var_name
+                    idx = var_index.get(var_name)
+                    if idx is None:
+                        idx = var_counter
+                        var_index[var_name] = idx
                         var_counter += 1
+                    full_problem.append(_var_token(idx))
 
                     token_spans.append((start_index, b, var_name))
                     b = b - 1
@@ -487,51 +728,131 @@ def translator(problem, custom_variables, settings):
     #   number/variable/')' followed by '(' / number / variable / function
     #
     # Examples:  "2x" -> "2 * x",  "3(4)" -> "3 * (4)",  ")(x" -> ") * (x"
-    b = 0
-    while b < len(full_problem):
-
-        if b + 1 < len(full_problem):
-
-            current_element = full_problem[b]
-            successor = full_problem[b + 1]
-            insertion_needed = False
-
-            # Classify the current and next tokens for the multiplication check.
-            is_function_name = isScOp(successor) != -1
-            is_number_or_variable = isinstance(current_element, (int, float, Decimal)) or (
-                        "var" in str(current_element) and
-                        isinstance(current_element, str))
-            is_paren_or_variable_or_number = (
-                        successor == '(' or ("var" in str(successor) and isinstance(successor, str)) or
-                        isinstance(successor, (int, float, Decimal)) or is_function_name)
-            is_not_an_operator = current_element not in Operations and successor not in Operations
-
-            # Only insert '*' when both sides are value-like and neither is
-            # already an operator.
-            if (is_number_or_variable or current_element == ')') and \
-                    (is_paren_or_variable_or_number or successor == '(') and \
-                    is_not_an_operator:
-
-                if current_element in ['*', '+', '-', '/'] or successor in ['*', '+', '-', '/']:
-                    insertion_needed = False
-                elif current_element == ')' and successor == '(':
-                    insertion_needed = True
-                elif current_element != '(' and successor != ')':
-                    insertion_needed = True
-
-            if insertion_needed:
-                next_pos = token_spans[b + 1][0] if b + 1 < len(token_spans) else b
-                token_spans.insert(b + 1, (next_pos, next_pos, "*_impl"))
-                full_problem.insert(b + 1, '*')
-
-        b += 1
+    #
+    # The output lists are rebuilt in one linear sweep instead of inserting
+    # into them in place (each list.insert shifts the whole tail).
+    kinds = _token_kinds(full_problem)
+    insert_after = [
+        index for index, (current_kind, next_kind) in enumerate(zip(kinds, kinds[1:]))
+        if current_kind & _ENDS_VALUE and next_kind & _STARTS_VALUE
+    ]
+    if insert_after:
+        tokens_out = []
+        spans_out = []
+        span_index = 0
+        previous = 0
+        for inserted, index in enumerate(insert_after):
+            tokens_out += full_problem[previous:index + 1]
+            tokens_out.append('*')
+            previous = index + 1
+
+            # Same position as the in-place insert: right after the span of
+            # the current token (token_spans can be shorter than the tokens)
+            target = index + 1 + inserted
+            take = min(target - len(spans_out), len(token_spans) - span_index)
+            spans_out += token_spans[span_index:span_index + take]
+            span_index += take
+            next_pos = token_spans[index + 1][0] if index + 1 < len(token_spans) else index + inserted
+            spans_out.append((next_pos, next_pos, "*_impl"))
+
+        tokens_out += full_problem[previous:]
+        spans_out += token_spans[span_index:]
+        full_problem = tokens_out
+        token_spans = spans_out
     return full_problem, var_counter, token_spans
 
 
+# Interned placeholder names for the first variables; every occurrence of a
+# variable shares one string instead of building "var" + str(n) each time.
+_VAR_TOKENS = tuple(sys.intern(f"var{index}") for index in range(64))
+
+
+def _var_token(index):
+    """Return the placeholder token (``"var<index>"``) for a variable."""
+    if index < len(_VAR_TOKENS):
+        return _VAR_TOKENS[index]
+    return sys.intern(f"var{index}")
+
+
+# Kind flags for the implicit-multiplication pass: a token that can be the
+# left side of an implicit '*' (number, variable, ')') ends a value, one that
+# can be its right side (number, variable, '(', function) starts a value.
+_ENDS_VALUE = 1
+_STARTS_VALUE = 2
+_STRING_TOKEN_KINDS = {')': _ENDS_VALUE, '(': _STARTS_VALUE,
+                       **{name: _STARTS_VALUE for name in Science_Operations}}
+
+
+def _token_kinds(tokens):
+    """Return the ``_ENDS_VALUE``/``_STARTS_VALUE`` flags of every token.
+
+    Each token is classified once, so the pair check of the implicit
+    multiplication pass is a bit test per neighbour instead of two
+    ``isinstance`` chains.
+    """
+    return [
+        ((_ENDS_VALUE | _STARTS_VALUE) if "var" in token else _STRING_TOKEN_KINDS.get(token, 0))
+        if isinstance(token, str)
+        else ((_ENDS_VALUE | _STARTS_VALUE) if isinstance(token, (int, float, Decimal)) else 0)
+        for token in tokens
+    ]
+
+
+@lru_cache(maxsize=4096)
+def _scientific_value(science_op, degree_mode):
+    """Memoized :func:`ScientificEngine.unknown_function`.
+
+    ``degree_mode`` is part of the key because sin/cos/tan read the
+    module-level degree setting.  Float results are returned as ``Decimal``
+    (through ``str``, exactly as ``Number`` converts them); error strings
+    and ``False`` pass through unchanged.
+    """
+    result = ScientificEngine.unknown_function(science_op)
+    if isinstance(result, float):
+        return Decimal(str(result))
+    return result
+
+
 # -----------------------------
 # Parser (recursive descent)
 # -----------------------------
 
+def _apply_bit2(bit_function, token, pos, argument_subtree, base_subtree, end_pos):
+    """Evaluate a two-argument bit function call such as ``setbit(a, b)``.
+
+    Args:
+        bit_function: The primitive from ``_BIT_FUNCS2``.
+        token (str): The function name, used in error messages.
+        pos (tuple): Source span of the function name.
+        argument_subtree: AST of the first argument.
+        base_subtree: AST of the second argument.
+        end_pos (tuple): Source span of the closing ``)``.
+
+    Returns:
+        Number: The result, spanning from the name to the closing ``)``.
+
+    Raises:
+        E.CalculationError: Non-integer arguments (code ``3041``), arguments
+            wider than the working precision or infinite (code ``3026``), or
+            a failing ``shl``/``shr``/``bitand``/``bitor`` (code ``3041``).
+        E.SyntaxError: Any other failing bit function (code ``8007``).
+    """
+    argument_value = argument_subtree.evaluate()
+    base_value = base_subtree.evaluate()
+    if not (_is_integral(argument_value) and _is_integral(base_value)):
+        raise E.CalculationError("Bit functions require integer values.", code="3041",
+                                 position_start=pos[0], position_end=end_pos[1])
+    try:
+        result = bit_function(argument_value, base_value)
+        if token == 'testbit':
+            result = 1 if result else 0
+        return Number(result, position_start=pos[0], position_end=end_pos[1])
+    except Exception as e:
+        if token in _BIT_CALCULATION_ERRORS:
+            raise E.CalculationError(str(e), code="3041", position_start=pos[0])
+        raise E.SyntaxError(f"Error in {token}: {e}", code="8007", position_start=pos[0])
+
+
 def ast(received_string, settings, custom_variables):
     """Parse a raw expression into an Abstract Syntax Tree using recursive descent.
 
@@ -587,19 +908,24 @@ def ast(received_string, settings, custom_variables):
         E.CalculationError:  On semantic issues (augmented assignment with
                              variables, trailing operators, etc.).
     """
-    analysed, var_counter, token_spans = translator(received_string, custom_variables, settings)
+    analysed, var_counter, token_spans = cached_translator(received_string, custom_variables, settings)
     d = 0
     mutliple_equalsign = False
     temp_position = -2
     expected_bool = False
+    operator_before_equals = False
     token_spans = list(token_spans)
 
     # --- Pre-scan: detect multiple / adjacent '=' signs ---
     # * Two non-adjacent '=' signs (e.g., "a = b = c") -> error.
     # * Two adjacent '=' signs (i.e., "==") -> set ``expected_bool`` so the
     #   caller treats the expression as an equality check returning bool.
+    # * Also notes whether any '=' follows an operator ("+=", "=="); only
+    #   then does the augmented-assignment walk below have work to do.
     while d < len(analysed):
         if analysed[d] == "=":
+            if d > 0 and analysed[d - 1] in OPERATIONS_SET:
+                operator_before_equals = True
             if temp_position != -2 and temp_position != d - 1:
                 # Second '=' found at a non-adjacent position -- ambiguous equation
                 err_pos = token_spans[d][0]
@@ -615,12 +941,15 @@ def ast(received_string, settings, custom_variables):
     if analysed == []:
         raise E.SyntaxError("Empty String", code="3034")
 
+    # Checked by several rules below; the rewrites never add or remove variables
+    has_variables = "var0" in analysed
+
     # Normalize spurious leading/trailing '='
-    if analysed and analysed[0] == "=" and not "var0" in analysed:
+    if analysed and analysed[0] == "=" and not has_variables:
         analysed.pop(0)
         token_spans.pop(0)  # Sync
 
-    if analysed and analysed[-1] == "=" and not "var0" in analysed:
+    if analysed and analysed[-1] == "=" and not has_variables:
         analysed.pop()
         token_spans.pop()  # Sync
 
@@ -633,12 +962,13 @@ def ast(received_string, settings, custom_variables):
     #   - Augmented assignment (e.g., "+=" rewritten to "= ( ... + ... )")
     #   - Operators adjacent to '=' without AA enabled -> error
     #   - Trailing operators with no right-hand operand -> error
-    if analysed:
+    if analysed and operator_before_equals:
+        allow_augmented = settings["allow_augmented_assignment"]
         b = 0
         while b < len(analysed) - 1:
             # Case 1: operator directly followed by '=' (e.g., "+=") without AA allowed
-            if (len(analysed) != b + 1) and (analysed[b + 1] == "=" and (analysed[b] in Operations)) and (
-                    settings["allow_augmented_assignment"] == False):
+            if (len(analysed) != b + 1) and (analysed[b + 1] == "=" and (analysed[b] in OPERATIONS_SET)) and (
+                    allow_augmented == False):
                 raise E.CalculationError("Missing Number before '='.", code="3028",
                                          position_start=token_spans[b + 1][0])
 
@@ -649,8 +979,8 @@ def ast(received_string, settings, custom_variables):
             #   3. Remove the original '=' token (the operator before it
             #      becomes the infix operator inside the parentheses).
             elif ((len(analysed) != b + 1 or len(analysed) != b + 2) and (
-                    analysed[b + 1] == "=" and (analysed[b] in Operations)) and (
-                          settings["allow_augmented_assignment"] == True) and not "var0" in analysed):
+                    analysed[b + 1] == "=" and (analysed[b] in OPERATIONS_SET)) and (
+                          allow_augmented == True) and not has_variables):
                 current_span = token_spans[b]
                 analysed.append(")")
                 token_spans.append((token_spans[-1][1], token_spans[-1][1], ")"))
@@ -663,32 +993,39 @@ def ast(received_string, settings, custom_variables):
 
             # Case 1b: AA with variables
             elif ((len(analysed) != b + 1 or len(analysed) != b + 2) and (
-                    analysed[b + 1] == "=" and (analysed[b] in Operations)) and (
-                          settings["allow_augmented_assignment"] == True) and "var0" in analysed):
+                    analysed[b + 1] == "=" and (analysed[b] in OPERATIONS_SET)) and (
+                          allow_augmented == True) and has_variables):
                 raise E.CalculationError("Augmented assignment not allowed with variables.", code="3030",
                                          position_start=token_spans[b][0])
 
             # Case 2: '=' precedes an operator
-            elif (b > 0) and (analysed[b + 1] == "=" and (analysed[b] in Operations)):
+            elif (b > 0) and (analysed[b + 1] == "=" and (analysed[b] in OPERATIONS_SET)):
                 raise E.CalculationError("Missing Number after '='.", code="3028", position_start=token_spans[b + 1][0])
 
             # Expression ends with an operator
-            elif analysed[-1] in Operations:
+            elif analysed[-1] in OPERATIONS_SET:
                 token_index_of_error = len(analysed) - 1
                 char_index_of_error = token_spans[token_index_of_error][1]
                 raise E.CalculationError(f"Missing Number after {analysed[-1]}", code="3029",
                                          position_start=char_index_of_error)
 
             # operator followed by '=' (AA disabled)
-            elif (analysed[b] in Operations and (analysed[b + 1] == "=" and (
-                    settings["allow_augmented_assignment"] == False))) and not "var0" in analysed:
+            elif (analysed[b] in OPERATIONS_SET and (analysed[b + 1] == "=" and (
+                    allow_augmented == False))) and not has_variables:
                 raise E.CalculationError(f"Missing Number after {analysed[b]}", code="3029",
                                          position_start=token_spans[b][1])
 
             b += 1
 
+    # Without an operator in front of an '=' the walk above can only ever
+    # report a trailing operator, so check for that directly.
+    elif len(analysed) > 1 and analysed[-1] in OPERATIONS_SET:
+        char_index_of_error = token_spans[len(analysed) - 1][1]
+        raise E.CalculationError(f"Missing Number after {analysed[-1]}", code="3029",
+                                 position_start=char_index_of_error)
+
     # '=' at start/end while a variable exists
-    if ((analysed and analysed[-1] == "=") or (analysed and analysed[0] == "=")) and "var0" in analysed:
+    if ((analysed and analysed[-1] == "=") or (analysed and analysed[0] == "=")) and has_variables:
         pos = token_spans[0][0] if analysed[0] == "=" else token_spans[-1][0]
         raise E.CalculationError(f"{received_string}", code="3025", position_start=pos)
 
@@ -696,6 +1033,10 @@ def ast(received_string, settings, custom_variables):
         print(analysed)
 
     # ---- Parsing functions in precedence order ----
+    # The binary-operator levels need no constant-folding guards of their
+    # own: BinOp folds constant operands when it is constructed, evaluate()
+    # and the bytecode compiler use that value, and prune_constants() turns
+    # folded subtrees into Number leaves for trees without variables.
 
     def parse_factor(tokens, token_spans):
         """Parse an atomic expression (highest precedence level).
@@ -709,10 +1050,9 @@ def ast(received_string, settings, custom_variables):
         * Bit-manipulation functions (``setbit``, ``bitnot``, ...) -> evaluated
           eagerly; two-argument variants consume a comma-separated second arg.
         """
-        list(token_spans)
         if len(tokens) > 0:
-            token = tokens.pop(0)
-            pos = token_spans.pop(0)
+            token = tokens.popleft()
+            pos = token_spans.popleft()
         else:
             raise E.CalculationError(f"Missing Number.", code="3027")
 
@@ -722,8 +1062,8 @@ def ast(received_string, settings, custom_variables):
             if not tokens or tokens[0] != ')':
                 err_pos = l_paren_pos[0]
                 raise E.SyntaxError("Missing closing parenthesis ')'", code="3009", position_start=err_pos)
-            tokens.pop(0)
-            token_spans.pop(0)
+            tokens.popleft()
+            token_spans.popleft()
             return subtree_in_paren
 
         # elif token in plugin_operations:
@@ -811,7 +1151,7 @@ def ast(received_string, settings, custom_variables):
         #         raise E.SyntaxError(f"Error in {token}: {e}", code="8007", position_start=pos[0])
 
 
-        elif token in Science_Operations:
+        elif token in SCIENCE_OPERATIONS_SET:
             if token == 'π':
                 result = ScientificEngine.isPi(token)
                 try:
@@ -825,20 +1165,20 @@ def ast(received_string, settings, custom_variables):
                     raise E.SyntaxError(f"Missing opening parenthesis after function {token}", code="3010",
                                         position_start=err_pos)
 
-                tokens.pop(0)
-                l_paren_pos = token_spans.pop(0)
+                tokens.popleft()
+                l_paren_pos = token_spans.popleft()
 
                 argument_subtree = parse_bor(tokens, token_spans)
 
                 if token == 'log' and tokens and tokens[0] == ',':
-                    tokens.pop(0)
-                    token_spans.pop(0)
+                    tokens.popleft()
+                    token_spans.popleft()
                     base_subtree = parse_bor(tokens, token_spans)
                     if not tokens or tokens[0] != ')':
                         raise E.SyntaxError(f"Missing closing parenthesis after logarithm base.", code="3009",
                                             position_start=l_paren_pos[0])
-                    tokens.pop(0)
-                    token_spans.pop(0)
+                    tokens.popleft()
+                    token_spans.popleft()
 
                     argument_value = argument_subtree.evaluate()
                     base_value = base_subtree.evaluate()
@@ -848,14 +1188,14 @@ def ast(received_string, settings, custom_variables):
                         # Fehler zeigt auf '('
                         raise E.SyntaxError(f"Missing closing parenthesis after function '{token}'", code="3009",
                                             position_start=l_paren_pos[0])
-                    tokens.pop(0)
-                    token_spans.pop(0)
+                    tokens.popleft()
+                    token_spans.popleft()
 
                     argument_value = argument_subtree.evaluate()
                     ScienceOp = f"{token}({argument_value})"
 
-                if token not in Bit_Operations:
-                    result_string = ScientificEngine.unknown_function(ScienceOp)
+                if token not in BIT_OPERATIONS_SET:
+                    result_string = _scientific_value(ScienceOp, ScientificEngine.degree_setting_sincostan)
                     if isinstance(result_string, str) and result_string.startswith("ERROR:"):
                         raise E.SyntaxError(result_string, code="3218", position_start=pos[0])
                     try:
@@ -864,14 +1204,14 @@ def ast(received_string, settings, custom_variables):
                         raise E.SyntaxError(f"Error in scientific function: {result_string}", code="3218",
                                             position_start=pos[0])
 
-        elif token in Bit_Operations:
+        elif token in BIT_OPERATIONS_SET:
             if not tokens or tokens[0] != '(':
                 err_pos = token_spans[0][0] if token_spans else pos[1]
                 raise E.SyntaxError(f"Missing opening parenthesis after bit function {token}", code="3010",
                                     position_start=err_pos)
 
-            tokens.pop(0)
-            l_paren_pos = token_spans.pop(0)
+            tokens.popleft()
+            l_paren_pos = token_spans.popleft()
 
             argument_subtree = parse_bor(tokens, token_spans)
 
@@ -887,16 +1227,16 @@ def ast(received_string, settings, custom_variables):
                     err_pos = token_spans[0][0] if token_spans else l_paren_pos[0]
                     raise E.SyntaxError(f"Missing comma after first argument in '{token}'", code="3009",
                                         position_start=err_pos)
-                tokens.pop(0)
-                token_spans.pop(0)
+                tokens.popleft()
+                token_spans.popleft()
 
                 base_sub = parse_bor(tokens, token_spans)
 
                 if not tokens or tokens[0] != ')':
                     raise E.SyntaxError(f"Missing closing parenthesis after '{token}' arguments.", code="3009",
                                         position_start=l_paren_pos[0])
-                tokens.pop(0)
-                end_pos = token_spans.pop(0)
+                tokens.popleft()
+                end_pos = token_spans.popleft()
                 return base_sub, end_pos
 
             def close_only():
@@ -904,121 +1244,13 @@ def ast(received_string, settings, custom_variables):
                 if not tokens or tokens[0] != ')':
                     raise E.SyntaxError(f"Missing closing parenthesis after function '{token}'", code="3009",
                                         position_start=l_paren_pos[0])
-                tokens.pop(0)
-                token_spans.pop(0)
-
-            if token == 'setbit':
-                base_subtree, end_pos = get_second_arg_and_close()
-                argument_value = argument_subtree.evaluate()
-                base_value = base_subtree.evaluate()
-                if argument_value % 1 != 0 or base_value % 1 != 0:
-                    raise E.CalculationError("Bit functions require integer values.", code="3041",
-                                             position_start=pos[0], position_end=end_pos[1])
-                try:
-                    return Number(setbit(argument_value, base_value), position_start=pos[0],
-                                  position_end=end_pos[1])
-                except Exception as e:
-                    raise E.SyntaxError(f"Error in {token}: {e}", code="8007", position_start=pos[0])
-
-
-            elif token == 'bitxor':
-                    base_subtree, end_pos = get_second_arg_and_close()
-                    argument_value = argument_subtree.evaluate()
-                    base_value = base_subtree.evaluate()
-                    if argument_value % 1 != 0 or base_value % 1 != 0:
-                        raise E.CalculationError("Bit functions require integer values.", code="3041",
-                                                 position_start=pos[0], position_end=end_pos[1])
-                    try:
-                        return Number(bitxor(argument_value, base_value), position_start=pos[0],
-                                      position_end=end_pos[1])
-                    except Exception as e:
-                        raise E.SyntaxError(f"Error in {token}: {e}", code="8007", position_start=pos[0])
-
-            elif token == 'clrbit':
-                base_subtree, end_pos = get_second_arg_and_close()
-                argument_value = argument_subtree.evaluate()
-                base_value = base_subtree.evaluate()
-                if argument_value % 1 != 0 or base_value % 1 != 0:
-                    raise E.CalculationError("Bit functions require integer values.", code="3041",
-                                             position_start=pos[0], position_end=end_pos[1])
-                try:
-                    return Number(clrbit(argument_value, base_value), position_start=pos[0], position_end=end_pos[1])
-                except Exception as e:
-                    raise E.SyntaxError(f"Error in {token}: {e}", code="8007", position_start=pos[0])
-
-            elif token == 'togbit':
-                base_subtree, end_pos = get_second_arg_and_close()
-                argument_value = argument_subtree.evaluate()
-                base_value = base_subtree.evaluate()
-                if argument_value % 1 != 0 or base_value % 1 != 0:
-                    raise E.CalculationError("Bit functions require integer values.", code="3041",
-                                             position_start=pos[0], position_end=end_pos[1])
-                try:
-                    return Number(togbit(argument_value, base_value), position_start=pos[0], position_end=end_pos[1])
-                except Exception as e:
-                    raise E.SyntaxError(f"Error in {token}: {e}", code="8007", position_start=pos[0])
-
-            elif token == 'testbit':
-                base_subtree, end_pos = get_second_arg_and_close()
-                argument_value = argument_subtree.evaluate()
-                base_value = base_subtree.evaluate()
-                if argument_value % 1 != 0 or base_value % 1 != 0:
-                    raise E.CalculationError("Bit functions require integer values.", code="3041",
-                                             position_start=pos[0], position_end=end_pos[1])
-                try:
-                    result_bool = testbit(argument_value, base_value)
-                    val = 1 if result_bool else 0
-                    return Number(val, position_start=pos[0], position_end=end_pos[1])
-                except Exception as e:
-                    raise E.SyntaxError(f"Error in {token}: {e}", code="8007", position_start=pos[0])
-
-            elif token == 'shl':
-                base_subtree, end_pos = get_second_arg_and_close()
-                argument_value = argument_subtree.evaluate()
-                base_value = base_subtree.evaluate()
-                if argument_value % 1 != 0 or base_value % 1 != 0:
-                    raise E.CalculationError("Bit functions require integer values.", code="3041",
-                                             position_start=pos[0], position_end=end_pos[1])
-                try:
-                    return Number(shl(argument_value, base_value), position_start=pos[0], position_end=end_pos[1])
-                except Exception as e:
-                    raise E.CalculationError(str(e), code="3041", position_start=pos[0])
-
-            elif token == 'shr':
-                base_subtree, end_pos = get_second_arg_and_close()
-                argument_value = argument_subtree.evaluate()
-                base_value = base_subtree.evaluate()
-                if argument_value % 1 != 0 or base_value % 1 != 0:
-                    raise E.CalculationError("Bit functions require integer values.", code="3041",
-                                             position_start=pos[0], position_end=end_pos[1])
-                try:
-                    return Number(shr(argument_value, base_value), position_start=pos[0], position_end=end_pos[1])
-                except Exception as e:
-                    raise E.CalculationError(str(e), code="3041", position_start=pos[0])
-
-            elif token == 'bitand':
-                base_subtree, end_pos = get_second_arg_and_close()
-                argument_value = argument_subtree.evaluate()
-                base_value = base_subtree.evaluate()
-                if argument_value % 1 != 0 or base_value % 1 != 0:
-                    raise E.CalculationError("Bit functions require integer values.", code="3041",
-                                             position_start=pos[0], position_end=end_pos[1])
-                try:
-                    return Number(bitand(argument_value, base_value), position_start=pos[0], position_end=end_pos[1])
-                except Exception as e:
-                    raise E.CalculationError(str(e), code="3041", position_start=pos[0])
+                tokens.popleft()
+                token_spans.popleft()
 
-            elif token == 'bitor':
+            bit_function = _BIT_FUNCS2.get(token)
+            if bit_function is not None:
                 base_subtree, end_pos = get_second_arg_and_close()
-                argument_value = argument_subtree.evaluate()
-                base_value = base_subtree.evaluate()
-                if argument_value % 1 != 0 or base_value % 1 != 0:
-                    raise E.CalculationError("Bit functions require integer values.", code="3041",
-                                             position_start=pos[0], position_end=end_pos[1])
-                try:
-                    return Number(bitor(argument_value, base_value), position_start=pos[0], position_end=end_pos[1])
-                except Exception as e:
-                    raise E.CalculationError(str(e), code="3041", position_start=pos[0])
+                return _apply_bit2(bit_function, token, pos, argument_subtree, base_subtree, end_pos)
 
             elif token == "bitnot":
                 if tokens and tokens[0] == ',':
@@ -1029,11 +1261,11 @@ def ast(received_string, settings, custom_variables):
                     err_pos = token_spans[0][0] if token_spans else pos[1] + 1
                     raise E.SyntaxError(f"Missing closing parenthesis after function '{token}'", code="3009",
                                         position_start=err_pos)
-                tokens.pop(0)
-                end_paren_span = token_spans.pop(0)
+                tokens.popleft()
+                end_paren_span = token_spans.popleft()
 
                 argument_value = argument_subtree.evaluate()
-                if argument_value % 1 != 0:
+                if not _is_integral(argument_value):
                     arg_start = argument_subtree.position_start if argument_subtree.position_start != -1 else pos[0]
                     arg_end = argument_subtree.position_end if argument_subtree.position_end != -1 else end_paren_span[
                         1]
@@ -1051,12 +1283,14 @@ def ast(received_string, settings, custom_variables):
 
         elif isinstance(token, Decimal):
             return Number(token, position_start=pos[0], position_end=pos[1])
+        # Before the numeric probes: isInt()/isfloat() raise internally on
+        # every variable placeholder, and no numeric string contains "var"
+        elif isinstance(token, str) and "var" in token:
+            return Variable(token, position_start=pos[0], position_end=pos[1])
         elif isInt(token):
             return Number(token, position_start=pos[0], position_end=pos[1])
         elif isfloat(token):
             return Number(token, position_start=pos[0], position_end=pos[1])
-        elif "var" in str(token):
-            return Variable(token, position_start=pos[0], position_end=pos[1])
         else:
             raise E.SyntaxError(f"Unexpected token: {token}", code="3012", position_start=pos[0])
 
@@ -1070,8 +1304,8 @@ def ast(received_string, settings, custom_variables):
         itself to allow chained unary operators (e.g., ``--x``).
         """
         if tokens and tokens[0] in ('+', '-'):
-            operator = tokens.pop(0)
-            pos = token_spans.pop(0)  # Sync
+            operator = tokens.popleft()
+            pos = token_spans.popleft()  # Sync
             operand = parse_unary(tokens, token_spans)
 
             if operator == '-':
@@ -1093,8 +1327,8 @@ def ast(received_string, settings, custom_variables):
         """
         current_subtree = parse_factor(tokens, token_spans)
         while tokens and (tokens[0] == "**"):
-            operator = tokens.pop(0)
-            pos = token_spans.pop(0)
+            operator = tokens.popleft()
+            pos = token_spans.popleft()
             right_part = parse_unary(tokens, token_spans)
             if not isinstance(current_subtree, Variable) and not isinstance(right_part, Variable):
                 base = current_subtree.evaluate()
@@ -1114,8 +1348,8 @@ def ast(received_string, settings, custom_variables):
         """
         current_subtree = parse_unary(tokens, token_spans)
         while tokens and tokens[0] in ("*", "/"):
-            operator = tokens.pop(0)
-            pos = token_spans.pop(0)  # Sync
+            operator = tokens.popleft()
+            pos = token_spans.popleft()  # Sync
             right_part = parse_unary(tokens, token_spans)
             current_subtree = BinOp(current_subtree, operator, right_part, position_start=pos[0], position_end=pos[1])
         return current_subtree
@@ -1129,8 +1363,8 @@ def ast(received_string, settings, custom_variables):
         """
         current_subtree = parse_sum(tokens, token_spans)
         while tokens and tokens[0] in ("<<", ">>"):
-            operator = tokens.pop(0)
-            pos = token_spans.pop(0)  # Sync
+            operator = tokens.popleft()
+            pos = token_spans.popleft()  # Sync
             right_part = parse_sum(tokens, token_spans)
             current_subtree = BinOp(current_subtree, operator, right_part, position_start=pos[0], position_end=pos[1])
         return current_subtree
@@ -1144,8 +1378,8 @@ def ast(received_string, settings, custom_variables):
         """
         current_subtree = parse_term(tokens, token_spans)
         while tokens and tokens[0] in ("+", "-"):
-            operator = tokens.pop(0)
-            pos = token_spans.pop(0)  # Sync
+            operator = tokens.popleft()
+            pos = token_spans.popleft()  # Sync
             right_part = parse_term(tokens, token_spans)
             current_subtree = BinOp(current_subtree, operator, right_part, position_start=pos[0], position_end=pos[1])
         return current_subtree
@@ -1158,8 +1392,8 @@ def ast(received_string, settings, custom_variables):
         """
         current_subtree = parse_bxor(tokens, token_spans)
         while tokens and tokens[0] == "|":
-            operator = tokens.pop(0)
-            pos = token_spans.pop(0)  # Sync
+            operator = tokens.popleft()
+            pos = token_spans.popleft()  # Sync
             right_part = parse_bxor(tokens, token_spans)
             current_subtree = BinOp(current_subtree, operator, right_part, position_start=pos[0], position_end=pos[1])
         return current_subtree
@@ -1169,8 +1403,8 @@ def ast(received_string, settings, custom_variables):
         """Parse bitwise XOR (``^``).  Left-associative."""
         current_subtree = parse_band(tokens, token_spans)
         while tokens and tokens[0] == "^":
-            operator = tokens.pop(0)
-            pos = token_spans.pop(0)  # Sync
+            operator = tokens.popleft()
+            pos = token_spans.popleft()  # Sync
             right_part = parse_band(tokens, token_spans)
             current_subtree = BinOp(current_subtree, operator, right_part, position_start=pos[0], position_end=pos[1])
         return current_subtree
@@ -1180,8 +1414,8 @@ def ast(received_string, settings, custom_variables):
         """Parse bitwise AND (``&``).  Left-associative."""
         current_subtree = parse_shift(tokens, token_spans)
         while tokens and tokens[0] == "&":
-            operator = tokens.pop(0)
-            pos = token_spans.pop(0)  # Sync
+            operator = tokens.popleft()
+            pos = token_spans.popleft()  # Sync
             right_part = parse_shift(tokens, token_spans)
             current_subtree = BinOp(current_subtree, operator, right_part, position_start=pos[0], position_end=pos[1])
         return current_subtree
@@ -1196,14 +1430,22 @@ def ast(received_string, settings, custom_variables):
         """
         left_side = parse_bor(tokens, token_spans)
         if tokens and tokens[0] == "=":
-            operator = tokens.pop(0)
-            pos = token_spans.pop(0)  # Sync
-            right_part = parse_shift(tokens, token_spans)
+            operator = tokens.popleft()
+            pos = token_spans.popleft()  # Sync
+            # Same precedence entry point as the left side, so '|', '^' and
+            # '&' on the right are parsed instead of silently dropped
+            right_part = parse_bor(tokens, token_spans)
             return BinOp(left_side, operator, right_part)
         return left_side
 
     # --- Build the final AST from the full token stream ---
-    final_tree = parse_gleichung(analysed, token_spans)
+    # The parsers consume tokens from the front; deques make that O(1)
+    # (list.pop(0) shifts the whole remaining list every time).
+    final_tree = parse_gleichung(deque(analysed), deque(token_spans))
+    if var_counter == 0:
+        # Constant subtrees collapse to single leaves (see prune_constants
+        # for why trees with variables keep their structure)
+        final_tree = prune_constants(final_tree)
 
     # Determine whether the expression is an equation (CAS mode).
     # ``cas`` is True whenever the root node is ``BinOp('=')``, regardless of
@@ -1265,7 +1507,7 @@ def solve(tree, var_name):
 # Result formatting
 # -----------------------------
 
-def cleanup(result):
+def cleanup(result, settings):
     """Format a raw numeric result according to the active settings.
 
     Processing order:
@@ -1278,6 +1520,8 @@ def cleanup(result):
 
     Args:
         result: The raw evaluation result (typically ``Decimal``).
+        settings (dict): The settings already loaded by :func:`calculate`;
+            ``decimal_places`` and ``fractions`` are read from it.
 
     Returns:
         tuple: ``(formatted_value, rounding_flag)`` where *rounding_flag*
@@ -1285,8 +1529,8 @@ def cleanup(result):
     """
     rounding = locals().get('rounding', False)
 
-    target_decimals = config_manager.load_setting_value("decimal_places")
-    target_fractions = config_manager.load_setting_value("fractions")
+    target_decimals = settings.get("decimal_places", 0)
+    target_fractions = settings.get("fractions", 0)
 
     # Try Fraction rendering if enabled and the result is Decimal
     if target_fractions == True and isinstance(result, Decimal):
@@ -1323,25 +1567,29 @@ def cleanup(result):
         # Integers are returned as-is (just normalized),
         # while non-integers are rounded to 'target_decimals'.
         #
-        # A temporary precision boost (prec=128) prevents
-        # Decimal.InvalidOperation during quantize() for long or repeating numbers.
-        # After rounding, precision is reset to the global standard (50).
+        # quantize() raises InvalidOperation when the rounded coefficient
+        # needs more digits than the context precision, so only that call
+        # runs in a local context widened to the digits it actually needs.
         #
 
-        if result % 1 == 0:
+        # An integer part wider than the working precision has already been
+        # rounded away; reject it (formerly signalled by ``result % 1``)
+        if not result.is_finite() or (result.adjusted() >= getcontext().prec and result != 0):
+            raise E.CalculationError("Number too large or invalid operation (Arithmetic overflow).", code="3026")
+
+        if _is_integral(result):
             # Integer result – return normalized without rounding
             return result, rounding
         else:
             # Non-integer result (e.g. 1/3 or repeating decimals)
-            getcontext().prec = 10000  # Prevent quantize overflow
-
             if target_decimals >= 0:
                 rounding_pattern = Decimal('1e-' + str(target_decimals))
             else:
                 rounding_pattern = Decimal('1')
 
-            rounded_result = result.quantize(rounding_pattern)
-            getcontext().prec = 10000  # Restore standard precision
+            with localcontext() as ctx:
+                ctx.prec = max(ctx.prec, max(result.adjusted() + 1, 1) + max(target_decimals, 0))
+                rounded_result = result.quantize(rounding_pattern)
 
             if rounded_result != result:
                 rounding = True
@@ -1403,19 +1651,30 @@ def calculate(problem: str, custom_variables: Union[dict, None] = None, validate
     Raises:
         E.MathError: (or subclass) on any parsing, evaluation, or conversion failure.
     """
+    # Run in a private copy of the decimal context: the precision chosen below
+    # must neither leak into nor depend on the caller's context.
+    with localcontext():
+        return _calculate(problem, custom_variables, validate)
+
+
+def _calculate(problem, custom_variables, validate):
+    """Body of :func:`calculate`; runs inside a private decimal context."""
     if custom_variables is None:
         custom_variables = {}
-    # Guard precision locally before each calculation (UI may adjust as well)
-    getcontext().prec = 10000
-    settings = config_manager.load_setting_value("all")  # pass UI settings down to parser
+    settings = config_manager.load_all_cached()  # pass UI settings down to parser
     global debug
     debug = settings.get("debug", False)
     target_places = settings.get("decimal_places", 2)
+    # Flags consulted repeatedly below; read once
+    only_hex = settings.get("only_hex", False) == True
+    only_binary = settings.get("only_binary", False) == True
+    only_octal = settings.get("only_octal", False) == True
+    correct_output_format = settings.get("correct_output_format", False)
 
     # -------------------------------------------------------------------
     # Dynamic Decimal precision scaling
     # -------------------------------------------------------------------
-    # The global Decimal context precision is tuned per-calculation so that
+    # The (call-local) Decimal context precision is tuned per-calculation so that
     # it is always large enough to represent the input numbers and the
     # desired output decimal places without silent truncation, yet not
     # wastefully large (capped at 10 000 to avoid excessive memory use).
@@ -1425,11 +1684,9 @@ def calculate(problem: str, custom_variables: Union[dict, None] = None, validate
     #                           max_variable_digits + BUFFER,
     #                           target_decimal_places + BUFFER)
     # -------------------------------------------------------------------
-    input_numbers = re.findall(r'\d+(?:\.\d+)?', problem)
-
-    max_input_length = len(max(input_numbers, key=len)) if input_numbers else 0
+    max_input_length = max((match.end() - match.start() for match in INPUT_NUMBER_RE.finditer(problem)),
+                           default=0)
 
-    MAX_DIGIT_LIMIT = 20000
     if max_input_length > MAX_DIGIT_LIMIT:
         raise E.CalculationError(
             f"Input number exceeds limit of {MAX_DIGIT_LIMIT} digits.",
@@ -1441,13 +1698,10 @@ def calculate(problem: str, custom_variables: Union[dict, None] = None, validate
     max_var_length = 0
     for val in custom_variables.values():
         s_val = str(val)
-        clean_len = len(s_val.replace('.', '').replace('-', ''))
+        clean_len = len(s_val) - s_val.count('.') - s_val.count('-')
         if clean_len > max_var_length:
             max_var_length = clean_len
 
-    SAFETY_BUFFER = 50
-    MIN_PRECISION = 100
-
     needed_precision = max(
         MIN_PRECISION,
         max_input_length + SAFETY_BUFFER,
@@ -1455,7 +1709,7 @@ def calculate(problem: str, custom_variables: Union[dict, None] = None, validate
         target_places + SAFETY_BUFFER
     )
 
-    needed_precision = min(needed_precision, 10000)
+    needed_precision = min(needed_precision, MAX_PRECISION)
     getcontext().prec = needed_precision
 
     if debug == True:
@@ -1470,69 +1724,44 @@ def calculate(problem: str, custom_variables: Union[dict, None] = None, validate
     # After detection the prefix is stripped from ``problem`` so the
     # tokenizer receives a clean mathematical expression.
     # -------------------------------------------------------------------
-    var_list = []
-    allowed_prefix = (
-        "dec:", "d:", "Decimal:",
-        "int:", "i:", "integer:",
-        "float:", "f:",
-        "bool:", "bo", "boolean:",
-        "hex:", "h:", "hexadecimal:",
-        "str:", "s:", "string:",
-        "bin:", "bi:", "binary:",
-        "oc:", "o:", "octal:"
-    )
     output_prefix = ""
-    problem_lower = problem.lower()
     try:
-        # Try each known prefix (case-insensitive) and normalise to canonical form.
-        for prefix in allowed_prefix:
-            if problem_lower.startswith(prefix):
-                if prefix.startswith("s")or prefix.startswith("S"):
-                    output_prefix = "string:"
-                elif prefix.startswith("bo")or prefix.startswith("Bo"):
-                    output_prefix = "boolean:"
-                elif prefix.startswith("d") or prefix.startswith("D"):
-                    output_prefix = "decimal:"
-                elif prefix.startswith("f") or prefix.startswith("F"):
-                    output_prefix = "float:"
-                elif prefix.startswith("i") or prefix.startswith("I"):
-                    output_prefix = "int:"
-                elif prefix.startswith("h") or prefix.startswith("H"):
-                    output_prefix = "hexadecimal:"
-                elif prefix.startswith("bi") or prefix.startswith("Bi"):
-                    output_prefix = "binary:"
-                elif prefix.startswith("o") or prefix.startswith("O"):
-                    output_prefix = "octal:"
-
-                # Strip the prefix (including the ':') from the expression.
-                start = problem.index(":")
-                problem = problem[start+1:]
-                break
+        # Match a known prefix (case-insensitive) and normalise to canonical form.
+        prefix_match = OUTPUT_PREFIX_RE.match(problem)
+        if prefix_match:
+            alias = prefix_match.group(1)
+            if alias is None:
+                # Bare "bo": strip through the first ':' (ValueError if none)
+                output_prefix = "boolean:"
+                problem = problem[problem.index(":") + 1:]
+            else:
+                output_prefix = OUTPUT_PREFIX_ALIASES[alias.lower()]
+                problem = problem[prefix_match.end():]
 
 
         # --- AST construction ---
-        final_tree, cas, var_counter, expected_bool = ast(problem, settings, custom_variables)
+        final_tree, cas, var_counter, expected_bool = cached_ast(problem, settings, custom_variables)
 
         # --- Reconcile expected_bool with user-specified prefix ---
         # When '==' was detected (expected_bool=True) but the user supplied a
         # non-boolean prefix, behaviour depends on the ``correct_output_format``
         # setting: if False -> error; if True -> silently override to boolean.
-        if output_prefix != "boolean:" and expected_bool == True and output_prefix != "" and settings["correct_output_format"]== False:
+        if output_prefix != "boolean:" and expected_bool == True and output_prefix != "" and correct_output_format == False:
             raise E.SyntaxError("Couldnt convert result into the given prefix", code="3037")
 
         elif output_prefix != "boolean:" and expected_bool == True and output_prefix == "":
             output_prefix = "boolean:"
 
-        elif output_prefix != "boolean:" and expected_bool == True and settings["correct_output_format"]== True:
+        elif output_prefix != "boolean:" and expected_bool == True and correct_output_format == True:
             output_prefix = "boolean:"
 
         # When ``only_*`` mode is active and no explicit prefix was provided,
         # default the output to the corresponding base representation.
-        if output_prefix == "" and settings["only_hex"] == True:
+        if output_prefix == "" and only_hex:
             output_prefix = "hexadecimal:"
-        elif output_prefix == "" and settings["only_binary"] == True:
+        elif output_prefix == "" and only_binary:
             output_prefix = "binary:"
-        elif output_prefix == "" and settings["only_octal"] == True:
+        elif output_prefix == "" and only_octal:
             output_prefix = "octal:"
 
         if validate == 0:
@@ -1553,7 +1782,7 @@ def calculate(problem: str, custom_variables: Union[dict, None] = None, validate
         if cas and var_counter > 0:
             # --- Path 1: Solve linear equation for the first variable ---
             var_name_in_ast = "var0"
-            if settings["only_hex"] == True or settings["only_binary"] == True or settings["only_octal"] == True:
+            if only_hex or only_binary or only_octal:
                 raise E.SolverError("Variables not supported with only_hex, only_binary or only_octal mode.",
                                     code="3038")
             if validate == 1:
@@ -1571,9 +1800,11 @@ def calculate(problem: str, custom_variables: Union[dict, None] = None, validate
                 output_prefix = "boolean:"
             left_val = final_tree.left.evaluate()
             right_val = final_tree.right.evaluate()
-            output_string = "True" if left_val == right_val else "False"
+            # Compare once; Decimal.__eq__ is already the cheapest exact test
+            is_equal = left_val == right_val
+            output_string = "True" if is_equal else "False"
             if validate == 1:
-                result = (left_val == right_val)
+                result = is_equal
             if output_prefix != "boolean:" and output_prefix != "string:" and output_prefix != "":
                 raise E.ConversionOutputError("Couldnt convert result into the given prefix", code = "8006")
             if output_prefix == "boolean:":
@@ -1588,7 +1819,7 @@ def calculate(problem: str, custom_variables: Union[dict, None] = None, validate
             if cas:
                 raise E.SolverError("The solver was used on a non-equation", code="3005")
             elif not cas and not "=" in problem:
-                if settings["only_hex"] == True or settings["only_binary"] == True or settings["only_octal"] == True:
+                if only_hex or only_binary or only_octal:
                     raise E.SolverError("Variables not supported with only_hex, only_binary or only_octal mode.", code="3038")
                 raise E.SolverError("No '=' found, although a variable was specified.", code="3012")
             elif cas and "=" in problem and (
@@ -1603,7 +1834,7 @@ def calculate(problem: str, custom_variables: Union[dict, None] = None, validate
         # Pass the raw numeric result through cleanup() for fraction rendering
         # and decimal rounding, then enforce any configured word/bit limit.
         if validate == 1:
-            result, rounding = cleanup(result)
+            result, rounding = cleanup(result, settings)
             result = apply_word_limit(result, settings)
         approx_sign = "\u2248"  # "approx" sign used when rounding was applied
         if validate == 1:
@@ -1645,20 +1876,17 @@ def calculate(problem: str, custom_variables: Union[dict, None] = None, validate
 
             elif output_prefix == "hexadecimal:":
                 try:
-                    int_to_value(output_string, output_prefix, settings)
                     return int_to_value(output_string, output_prefix, settings)
                 except Exception as e:
                     raise E.ConversionOutputError("Couldnt convert type to" + str(output_prefix), code="8003")
 
             elif output_prefix == "binary:":
                 try:
-                    int_to_value(output_string, output_prefix, settings)
                     return int_to_value(output_string, output_prefix, settings)
                 except Exception as e:
                     raise E.ConversionOutputError("Couldnt convert type to" + str(output_prefix), code="8003")
             elif output_prefix == "octal:":
                 try:
-                    int_to_value(output_string, output_prefix, settings)
                     return int_to_value(output_string, output_prefix, settings)
                 except Exception as e:
                     raise E.ConversionOutputError("Couldnt convert type to" + str(output_prefix), code="8003")
@@ -1744,16 +1972,16 @@ def calculate(problem: str, custom_variables: Union[dict, None] = None, validate
 
 
 def test_main():
-    """Simple recursive REPL for manual testing of the calculation engine.
+    """Simple REPL for manual testing of the calculation engine.
 
     Reads an expression from stdin, evaluates it, prints the result,
     and loops.  Only intended for standalone development testing.
     """
-    print("Enter the problem: ")
-    problem = input()
-    result = calculate(problem)
-    print(result)
-    test_main()  # recursive call disabled
+    while True:
+        print("Enter the problem: ")
+        problem = input()
+        result = calculate(problem)
+        print(result)
 
 if __name__ == "__main__":
     test_main()
\ No newline at end of file
@@ -0,0 +1,237 @@
+"""
+Compile expression trees to native-speed float functions.
+
+For repeated evaluations of the same tree with changing variable bindings
+(solver sweeps, plotting, tables) interpreting the Decimal AST every time is
+pure overhead.  :func:`compile_float` lowers a tree once to a Python function
+of the form::
+
+    def f(v0, v1, ...):
+        return ((v0 + 3.0) * v1 - ...)
+
+and, when ``numba`` is installed, JIT-compiles it with ``numba.njit``.  The
+generated functions are cached by their source, so structurally identical
+trees share one compiled function.
+
+:func:`evaluate_array` covers the same use case for whole parameter sweeps at
+once: it runs the tree's bytecode with NumPy ufuncs, so every operator is a
+single vectorized pass over all inputs (requires ``numpy``).
+
+The float path is an opt-in approximation: it trades the engine's exact
+Decimal arithmetic for float64 speed.  Whenever float64 cannot produce a
+meaningful result (overflow, division by zero, non-finite values) the call
+falls back to the exact Decimal stack machine, which also raises the usual
+engine errors.
+"""
+
+import math
+from decimal import Decimal
+from functools import lru_cache
+
+from ..utility import error as E
+from .AST_Node_Types import (
+    LOAD_CONST,
+    LOAD_VAR,
+    OPCODES,
+    run,
+)
+
+@lru_cache(maxsize=None)
+def _load_numba():
+    """Import numba on first use; ``None`` if it is not installed.
+
+    Deferred so ``import math_engine`` does not pay numba's (large) import
+    cost for callers that never use the float path.
+    """
+    try:
+        import numba
+        import numba.core.errors
+    except ImportError:
+        return None
+    return numba
+
+
+# Operators that have an exact float64 counterpart.  Bitwise operators are
+# integer-only, so trees using them always take the Decimal path.
+_FLOAT_OPERATORS = {
+    OPCODES['+']: '+',
+    OPCODES['-']: '-',
+    OPCODES['*']: '*',
+    OPCODES['/']: '/',
+    OPCODES['**']: '**',
+    OPCODES['=']: '==',
+}
+
+
+def _to_source(code, consts, names):
+    """Turn bytecode into a single Python expression string.
+
+    Returns ``None`` if the tree uses an operator without a float equivalent
+    or a constant float64 cannot represent (``repr`` would emit a bare
+    ``inf``/``nan``); such trees take the exact path.
+    """
+    stack = []
+    instructions = iter(code)
+    for opcode, operand_index in zip(instructions, instructions):
+        operand = consts[operand_index]
+        if opcode == LOAD_CONST:
+            value = float(operand)
+            if not math.isfinite(value):
+                return None
+            stack.append(repr(value))
+        elif opcode == LOAD_VAR:
+            stack.append(f"v{names.index(operand.name)}")
+        else:
+            symbol = _FLOAT_OPERATORS.get(opcode)
+            if symbol is None:
+                return None
+            right = stack.pop()
+            left = stack.pop()
+            stack.append(f"({left} {symbol} {right})")
+    return stack.pop()
+
+
+@lru_cache(maxsize=256)
+def _build_function(expression, argument_count):
+    """Compile (and JIT, if available) ``expression`` into a function.
+
+    Cached on the expression string, which doubles as the structural key of
+    the tree.  Returns ``None`` if Python refuses to compile it (e.g. nesting
+    too deep for the parser).  The JIT compiles eagerly for float64 arguments
+    so numba errors surface here; if numba rejects the function the plain
+    Python version is used.
+    """
+    arguments = ", ".join(f"v{index}" for index in range(argument_count))
+    source = f"def _compiled({arguments}):\n    return {expression}\n"
+    namespace = {}
+    try:
+        exec(compile(source, "<math_engine.float_compiler>", "exec"), namespace)
+    except (SyntaxError, RecursionError, MemoryError):
+        return None
+
+    function = namespace["_compiled"]
+    numba = _load_numba()
+    if numba is not None:
+        try:
+            jitted = numba.njit(cache=False)(function)
+            jitted.compile((numba.float64,) * argument_count)
+        except numba.core.errors.NumbaError:
+            return function
+        function = jitted
+    return function
+
+
+def compile_float(tree):
+    """Compile an AST into a fast float64 evaluator.
+
+    Args:
+        tree: The AST root (``Number``, ``Variable``, or ``BinOp``).
+
+    Returns:
+        tuple: ``(evaluate, names)`` where ``names`` lists the variable names
+        in argument order and ``evaluate(*values)`` returns a ``float`` (or a
+        ``bool`` for ``=``).  If float64 cannot represent the result, the
+        exact ``Decimal`` result from the stack machine is returned instead.
+
+    Raises:
+        E.CalculationError, E.SolverError: Propagated from the Decimal
+            fallback (e.g. division by zero, code ``3003``).
+    """
+    code, consts, names = tree.compile()
+
+    expression = _to_source(code, consts, names)
+    function = None
+    if expression is not None:
+        function = _build_function(expression, len(names))
+
+    def exact(*values):
+        env = {name: Decimal(str(value)) for name, value in zip(names, values)}
+        return run(code, consts, env)
+
+    if function is None:
+        return exact, list(names)
+
+    def evaluate(*values):
+        try:
+            result = function(*[float(value) for value in values])
+        except (ZeroDivisionError, OverflowError):
+            return exact(*values)
+        if isinstance(result, complex) or (isinstance(result, float) and not math.isfinite(result)):
+            return exact(*values)
+        return result
+
+    return evaluate, list(names)
+
+
+# --- NumPy batch evaluation ---
+
+# Opcode -> name of the NumPy ufunc implementing it.  Resolved lazily so the
+# module imports fine without numpy.
+_NUMPY_UFUNCS = {
+    OPCODES['+']: 'add',
+    OPCODES['-']: 'subtract',
+    OPCODES['*']: 'multiply',
+    OPCODES['/']: 'true_divide',
+    OPCODES['**']: 'float_power',
+    OPCODES['=']: 'equal',
+    OPCODES['&']: 'bitwise_and',
+    OPCODES['|']: 'bitwise_or',
+    OPCODES['^']: 'bitwise_xor',
+    OPCODES['<<']: 'left_shift',
+    OPCODES['>>']: 'right_shift',
+}
+
+_NUMPY_BITWISE = frozenset(OPCODES[operator] for operator in ('&', '|', '^', '<<', '>>'))
+
+
+def evaluate_array(tree, env):
+    """Evaluate a tree for many variable bindings at once using NumPy.
+
+    Each operator becomes one vectorized ufunc call over all inputs.  Numeric
+    literals are converted to ``int64`` when integral (so bitwise operators
+    work on integer arrays) and to ``float64`` otherwise.  Float semantics
+    apply: division by zero yields ``inf``/``nan`` instead of raising.
+
+    Args:
+        tree: The AST root (``Number``, ``Variable``, or ``BinOp``).
+        env (dict): Maps variable names (e.g. ``"var0"``) to array-likes.
+
+    Returns:
+        numpy.ndarray: The element-wise results.
+
+    Raises:
+        ImportError: If numpy is not installed.
+        E.SolverError: Unbound variable (code ``3005``).
+        E.CalculationError: Bitwise operator on non-integer data (code ``3042``).
+    """
+    # Imported here, not at module level: numpy would almost double the time
+    # of ``import math_engine`` for callers that never use this function.
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError("evaluate_array() requires numpy (pip install numpy).") from None
+
+    code, consts, _ = tree.compile()
+    stack = []
+    instructions = iter(code)
+    for opcode, operand_index in zip(instructions, instructions):
+        operand = consts[operand_index]
+        if opcode == LOAD_CONST:
+            stack.append(np.int64(operand) if operand % 1 == 0 and abs(operand) < 2 ** 63 else np.float64(operand))
+        elif opcode == LOAD_VAR:
+            if operand.name not in env:
+                operand.evaluate()  # raises SolverError 3005
+            stack.append(np.asarray(env[operand.name]))
+        else:
+            right_value = stack.pop()
+            left_value = stack.pop()
+            if opcode in _NUMPY_BITWISE and not (np.issubdtype(np.result_type(left_value), np.integer)
+                                                 and np.issubdtype(np.result_type(right_value), np.integer)):
+                raise E.CalculationError(f"Operator '{operand.operator}' requires integers.", code="3042", position_start=operand.position_start)
+            ufunc = getattr(np, _NUMPY_UFUNCS.get(opcode, ''), None)
+            if ufunc is None:
+                raise E.CalculationError(f"Unknown operator: {operand.operator}", code="3004", position_start=operand.position_start)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                stack.append(ufunc(left_value, right_value))
+
+    return np.asarray(stack.pop())
@@ -33,8 +33,9 @@ See :func:`calculator.calculator.translator` for the actively-used version
 of the tokenizer.
 """
 
+import re
 from decimal import Decimal
-from math_engine.utility.utility import isInt, isfloat, isScOp, isOp
+from math_engine.utility.utility import isInt, isfloat
 from math_engine import config_manager as config_manager
 from math_engine.calculator import ScientificEngine
 from ..utility import error as E
@@ -53,6 +54,19 @@ Science_Operations = ["sin", "cos", "tan", "10^x", "log", "e^", "π", "√"]
 # Named bitwise-operation functions (e.g. setbit, bitnot, shl, ...).
 Bit_Operations = ["setbit", "bitxor", "shl", "shr", "bitnot", "bitand", "bitor", "clrbit", "togbit", "testbit"]
 
+# Hashed copies of :data:`Operations` / :data:`Science_Operations` for the
+# per-character and per-token membership tests (``isOp()``/``isScOp()``
+# raise and catch a ValueError on every miss).
+OPERATIONS_SET = frozenset(Operations)
+SCIENCE_OPERATIONS_SET = frozenset(Science_Operations)
+
+# The tail of a decimal literal: digits, '.', 'e'/'E', and a sign directly
+# after 'e'/'E'.  Malformed runs (two '.', two 'e') are reported afterwards.
+NUMBER_TAIL_RE = re.compile(r"(?:[\d.eE]|(?<=[eE])[+-])*")
+
+# The characters inside a literal that may occur at most once each.
+NUMBER_MARKER_RE = re.compile(r"[.eE]")
+
 # Reserved for dynamically-registered plugin operations (currently unused).
 plugin_operations = []
 
@@ -145,38 +159,20 @@ def translator(problem, custom_variables, settings):
     #  Initialisation
     # ------------------------------------------------------------------ #
     var_counter = 0
-    var_list = [None] * len(problem)  # Track seen variable symbols -> var0, var1, ...
+    var_index = {}       # Seen variable symbols -> N of their "varN" placeholder
     full_problem = []    # Accumulates the output token list
     token_spans = []     # Parallel list of (start_pos, end_pos, raw_text)
     b = 0                # Current scan index into *problem*
 
-    # ------------------------------------------------------------------ #
-    #  Pre-processing: build a look-up of context variables
-    # ------------------------------------------------------------------ #
-    # Convert all caller-supplied variable values to string form so they
-    # can be compared / substituted during the scan.
-    CONTEXT_VARS = {}
-    for var_name, value in custom_variables.items():
-        if isinstance(value, (int, float, Decimal)):
-            CONTEXT_VARS[var_name] = str(value)
-        elif isinstance(value, bool):
-            CONTEXT_VARS[var_name] = "1" if value else "0"
-        else:
-            CONTEXT_VARS[var_name] = str(value)
+    # Non-decimal input modes, read once instead of per token
+    only_hex = settings.get("only_hex", False) == True
+    only_binary = settings.get("only_binary", False) == True
+    only_octal = settings.get("only_octal", False) == True
+    non_decimal = only_hex or only_binary or only_octal
 
-    # Sort by descending length so that longer variable names are matched
-    # before shorter prefixes (e.g. "xy" before "x").
-    sorted_vars = sorted(CONTEXT_VARS.keys(), key=len, reverse=True)
+    # Custom variables are resolved per identifier in the variable / unknown
+    # identifier fallback of the scan below.
     HEX_DIGITS = "0123456789ABCDEFabcdef"
-    temp_problem = problem
-    # (Commented-out block: inline variable substitution was moved to the
-    #  per-token variable look-up below.)
-    # for var_name in sorted_vars:
-    #     value_str = CONTEXT_VARS[var_name]
-    #     value_str = value_str
-    #     temp_problem = temp_problem.replace(var_name, value_str)
-
-    problem = temp_problem
 
     # ================================================================== #
     #  PHASE 1 -- Main left-to-right character scan
@@ -187,7 +183,6 @@ def translator(problem, custom_variables, settings):
     # first, then numeric literals, operators, whitespace, parentheses,
     # hex digits (when in hex-only mode), the pi constant, and finally
     # the variable / unknown-identifier fallback.
-    temp_var = -1
     while b < len(problem):
         found_function = False
         current_char = problem[b]
@@ -211,7 +206,7 @@ def translator(problem, custom_variables, settings):
                 break
         if found_function:
             # Scientific functions are not available in non-decimal modes
-            if settings["only_hex"] == True or settings["only_binary"] == True or settings["only_octal"]== True:
+            if non_decimal:
                 raise E.SyntaxError(f"Function not support with only not decimals.", code="3033")
             continue
 
@@ -219,7 +214,8 @@ def translator(problem, custom_variables, settings):
         # Handles integers, floats, and scientific (exponential) notation
         # such as "1.5e-3".  First tries a non-decimal (hex/bin/oct) scan;
         # if that returns None, falls back to the general decimal scanner.
-        if isInt(current_char) or (b >= 0 and current_char == "."):
+        # str.isdecimal() accepts exactly the characters int() does
+        if current_char.isdecimal() or (b >= 0 and current_char == "."):
             start_index = b
 
             # Attempt non-decimal (hex/binary/octal prefix) scan first
@@ -233,52 +229,34 @@ def translator(problem, custom_variables, settings):
                 b = new_index - 1
 
             else:
-                # General decimal number scanner -- accumulates digits,
-                # at most one decimal point, and optional exponent part.
-                str_number = current_char
-                has_decimal_point = (current_char == '.')
+                # General decimal number scanner -- one regex call grabs the
+                # digits, decimal point and exponent part; then the first
+                # second '.' or second 'e'/'E' is reported, in input order.
+                end_index = NUMBER_TAIL_RE.match(problem, b + 1).end()
+                str_number = problem[start_index:end_index]
+                has_decimal_point = False
                 has_exponent_e = False
-
-                while (b + 1 < len(problem)):
-                    next_char = problem[b + 1]
-
-                    # 1. Decimal point -- only one allowed per number
-                    if next_char == ".":
-                        if has_decimal_point:
-                            raise E.SyntaxError(f"Double decimal point.", code="3008", position_start=b + 1)
-                        has_decimal_point = True
-
-                    # 2. Exponent indicator 'E' / 'e' -- only one allowed
-                    elif next_char in ('e', 'E'):
-                        if temp_var == b and b > 0:
-                            raise E.SyntaxError(f"Multiple digit variables not supported.",
-                                                code="3032", position_start=b + 1)
-                        if has_exponent_e:
-                            raise E.SyntaxError("Double exponent sign 'E'/'e'.", code="3031", position_start=b + 1)
-                        has_exponent_e = True
-
-                    # 3. Sign character ('+'/'-') is valid only immediately
-                    #    after the exponent indicator
-                    elif next_char in ('+', '-'):
-                        if not (problem[b] in ('e', 'E') and has_exponent_e):
-                            break
-
-                    # 4. Any non-digit character ends the number
-                    elif not isInt(next_char):
-                        break
-
-                    # Character is a valid continuation of this number
-                    b += 1
-                    str_number += problem[b]
+                # Plain digit runs (the common case) have no markers to check
+                if not str_number.isdecimal():
+                    for marker in NUMBER_MARKER_RE.finditer(str_number):
+                        if marker.group() == ".":
+                            if has_decimal_point:
+                                raise E.SyntaxError(f"Double decimal point.", code="3008", position_start=b + marker.start())
+                            has_decimal_point = True
+                        else:
+                            if has_exponent_e:
+                                raise E.SyntaxError("Double exponent sign 'E'/'e'.", code="3031", position_start=b + marker.start())
+                            has_exponent_e = True
+                b = end_index - 1
 
                 # Convert the accumulated string to a Decimal token,
                 # applying base conversion if a non-decimal mode is active
                 if isfloat(str_number) or isInt(str_number):
-                    if settings["only_hex"] == True:
+                    if only_hex:
                         str_number = value_to_int("0x"+str_number)
-                    elif settings["only_binary"] == True:
+                    elif only_binary:
                         str_number = value_to_int("0b"+str_number)
-                    elif settings["only_octal"] == True:
+                    elif only_octal:
                         str_number = value_to_int("0O"+str_number)
                     token_spans.append((start_index, b, str_number))
                     full_problem.append(Decimal(str_number))
@@ -291,7 +269,7 @@ def translator(problem, custom_variables, settings):
         # Recognises single-character operators (+, -, *, /, =, &, |, ^)
         # and two-character operators (**, <<, >>).  Invalid combinations
         # like <> or >< are rejected.
-        elif isOp(current_char) != -1:
+        elif current_char in OPERATIONS_SET:
             start_index = b
             # Check for the two-character power operator '**'
             if current_char == "*" and b + 1 < len(problem) and problem[b + 1] == "*":
@@ -351,13 +329,12 @@ def translator(problem, custom_variables, settings):
         # --- Hex-digit accumulation (only in hex-only mode) ---
         # When the settings enforce hexadecimal input, bare A-F / a-f
         # characters are consumed as part of a hex literal.
-        elif settings.get("only_hex", False) and current_char in HEX_DIGITS:
+        elif only_hex and current_char in HEX_DIGITS:
             # Collect all consecutive hex-digit characters (e.g. "FF", "1A3")
-            str_number = current_char
             start_index = b
             while b + 1 < len(problem) and problem[b + 1] in HEX_DIGITS:
                 b += 1
-                str_number += problem[b]
+            str_number = problem[start_index:b + 1]
 
             # Prefix with "0x" and convert to int, then wrap as Decimal
             try:
@@ -369,7 +346,7 @@ def translator(problem, custom_variables, settings):
 
         # --- Pi constant (standalone character) ---
         elif current_char == 'π':
-            if settings["only_hex"] == True or settings["only_binary"] == True or settings["only_octal"]== True:
+            if non_decimal:
                 raise E.SyntaxError(f"Error with constant π:{result_string}", code="3033", position_start=b)
             result_string = ScientificEngine.isPi(str(current_char))
             try:
@@ -386,15 +363,14 @@ def translator(problem, custom_variables, settings):
         # its value) or a new unknown (assign an internal "varN" name).
         else:
                 start_index = b
-                var_name = ""
                 # Greedily collect the full identifier
                 while b < len(problem):
                     char = problem[b]
                     if char.isalnum() or char == '_':
-                        var_name += char
                         b += 1
                     else:
                         break
+                var_name = problem[start_index:b]
 
                 if len(var_name) == 0:
                     # Not even a single valid identifier character found
@@ -430,15 +406,12 @@ def translator(problem, custom_variables, settings):
 
                     # Re-use existing internal name if the same symbol was
                     # already encountered, otherwise assign a new "varN".
-                    if var_name in var_list:
-                        idx = var_list.index(var_name)
+                    idx = var_index.get(var_name)
+                    if idx is not None:
                         full_problem.append("var" + str(idx))
                     else:
                         full_problem.append("var" + str(var_counter))
-                        if var_counter >= len(var_list):
-                            var_list.append(var_name)
-                        else:
-                            var_list[var_counter] = var_name
+                        var_index[var_name] = var_counter
                         var_counter += 1
 
                     token_spans.append((start_index, b, var_name))
@@ -458,51 +431,56 @@ def translator(problem, custom_variables, settings):
     #
     # The inserted token is tracked in token_spans as "*_impl" so that
     # debugging / error reporting can distinguish it from user-written '*'.
-    b = 0
-    while b < len(full_problem):
-
-        if b + 1 < len(full_problem):
-
-            current_element = full_problem[b]
-            successor = full_problem[b + 1]
-            insertion_needed = False
-
-            # Classify the current and next tokens
-            is_function_name = isScOp(successor) != -1
-            is_number_or_variable = isinstance(current_element, (int, float, Decimal)) or (
-                        "var" in str(current_element) and
-                        isinstance(current_element, str))
-            is_paren_or_variable_or_number = (
-                        successor == '(' or ("var" in str(successor) and isinstance(successor, str)) or
-                        isinstance(successor, (int, float, Decimal)) or is_function_name)
-            is_not_an_operator = current_element not in Operations and successor not in Operations
-
-            # Implicit multiplication is needed when the left token is a
-            # "value-like" token (number, variable, ')') and the right
-            # token is also "value-like" (number, variable, '(', function).
-            if (is_number_or_variable or current_element == ')') and \
-                    (is_paren_or_variable_or_number or successor == '(') and \
-                    is_not_an_operator:
-
-                # Exclude cases where an explicit operator already separates
-                # the two tokens, or where the pair is '(' ... ')'.
-                if current_element in ['*', '+', '-', '/'] or successor in ['*', '+', '-', '/']:
-                    insertion_needed = False
-                elif current_element == ')' and successor == '(':
-                    insertion_needed = True
-                elif current_element != '(' and successor != ')':
-                    insertion_needed = True
-
-            if insertion_needed:
-                # Insert the implicit '*' into both the token list and the
-                # span list so indices stay synchronised.
-                next_pos = token_spans[b + 1][0] if b + 1 < len(token_spans) else b
-                token_spans.insert(b + 1, (next_pos, next_pos, "*_impl"))
-                full_problem.insert(b + 1, '*')
-
-        b += 1
+    #
+    # The output lists are rebuilt in one linear sweep instead of inserting
+    # into them in place (each list.insert shifts the whole tail).
+    insert_after = [
+        index for index in range(len(full_problem) - 1)
+        if _needs_implicit_mul(full_problem[index], full_problem[index + 1])
+    ]
+    if insert_after:
+        tokens_out = []
+        spans_out = []
+        span_index = 0
+        previous = 0
+        for inserted, index in enumerate(insert_after):
+            tokens_out += full_problem[previous:index + 1]
+            tokens_out.append('*')
+            previous = index + 1
+
+            # Keep the span of the implicit '*' at the index the token got,
+            # even if token_spans is shorter than the token list
+            target = index + 1 + inserted
+            take = min(target - len(spans_out), len(token_spans) - span_index)
+            spans_out += token_spans[span_index:span_index + take]
+            span_index += take
+            next_pos = token_spans[index + 1][0] if index + 1 < len(token_spans) else index + inserted
+            spans_out.append((next_pos, next_pos, "*_impl"))
+
+        tokens_out += full_problem[previous:]
+        spans_out += token_spans[span_index:]
+        full_problem = tokens_out
+        token_spans = spans_out
     return full_problem, var_counter, token_spans
 
+
+def _needs_implicit_mul(current_element, successor):
+    """Return True if a ``'*'`` is implied between two adjacent tokens.
+
+    The left token must be value-like (number, variable, ``')'``) and the
+    right token must be value-like or open a group (number, variable,
+    ``'('``, function name); explicit operators never qualify.
+    """
+    # isinstance() first: str() of a long Decimal literal is expensive
+    if not (isinstance(current_element, (int, float, Decimal)) or current_element == ')'
+            or (isinstance(current_element, str) and "var" in current_element)):
+        return False
+    if not (isinstance(successor, (int, float, Decimal)) or successor == '('
+            or (isinstance(successor, str) and ("var" in successor or successor in SCIENCE_OPERATIONS_SET))):
+        return False
+    return current_element not in OPERATIONS_SET and successor not in OPERATIONS_SET
+
+
 # ---------------------------------------------------------------------------
 #  Standalone test harness
 # ---------------------------------------------------------------------------
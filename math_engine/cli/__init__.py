@@ -21,9 +21,15 @@ from .cli import (
 )
 
 # PromptSession is an optional dependency (requires prompt_toolkit).
-# Import it when available so that downstream code can detect REPL support;
-# silently ignore ImportError for environments that lack the package.
-try:
-    from .cli import PromptSession
-except ImportError:
-    pass
+# Resolved on first access so that importing the CLI does not load
+# prompt_toolkit; environments that lack the package get an AttributeError,
+# just as if the name had never been exported.
+def __getattr__(name):
+    if name == "PromptSession":
+        try:
+            from .cli import PromptSession
+        except ImportError:
+            pass
+        else:
+            return PromptSession
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
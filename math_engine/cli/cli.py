@@ -22,16 +22,11 @@ Entry points (defined in ``pyproject.toml``):
 """
 
 import argparse
+import importlib
+import re
 import sys
 import shlex
 import ast
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from prompt_toolkit import PromptSession
-from prompt_toolkit.completion import WordCompleter, NestedCompleter
-from prompt_toolkit.history import FileHistory
-from prompt_toolkit.styles import Style
 
 
 from .. import (
@@ -41,7 +36,63 @@ from .. import (
     reset_settings
 )
 
-console = Console()
+# ``rich`` and ``prompt_toolkit`` take well over 100 ms to import, which a
+# one-shot ``math-engine "3 + 3"`` should not pay for the REPL.  They are
+# imported on first use; the names stay module attributes (PEP 562), so e.g.
+# ``math_engine.cli.cli.PromptSession`` can still be looked up or patched.
+_LAZY_IMPORTS = {
+    "Console": ("rich.console", "Console"),
+    "Table": ("rich.table", "Table"),
+    "Panel": ("rich.panel", "Panel"),
+    "PromptSession": ("prompt_toolkit", "PromptSession"),
+    "WordCompleter": ("prompt_toolkit.completion", "WordCompleter"),
+    "NestedCompleter": ("prompt_toolkit.completion", "NestedCompleter"),
+    "FileHistory": ("prompt_toolkit.history", "FileHistory"),
+    "Style": ("prompt_toolkit.styles", "Style"),
+}
+
+# Module-level completers used as fallback / reference outside the REPL.
+_LAZY_COMPLETER_WORDS = {
+    "bool_completer": ['true', 'false', 'on', 'off'],
+    "word_size_completer": ['8', '16', '32', '64', '0'],
+}
+
+
+def _load(name):
+    """Return the lazily imported attribute *name*, importing it on first use."""
+    value = globals().get(name)
+    if value is None:
+        if name in _LAZY_COMPLETER_WORDS:
+            value = _load("WordCompleter")(_LAZY_COMPLETER_WORDS[name], ignore_case=True)
+        else:
+            module_name, attribute = _LAZY_IMPORTS[name]
+            value = getattr(importlib.import_module(module_name), attribute)
+        globals()[name] = value
+    return value
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS or name in _LAZY_COMPLETER_WORDS:
+        return _load(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazyConsole:
+    """Stand-in for the shared ``rich`` console that creates it on first use."""
+
+    def __init__(self):
+        self._console = None
+
+    def __getattr__(self, name):
+        if self._console is None:
+            self._console = _load("Console")()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
+
+# Characters that matter when splitting REPL input on top-level commas.
+_SPLIT_CHARS_RE = re.compile(r"[(),]")
 
 
 # ---------------------------------------------------------------------------
@@ -62,6 +113,7 @@ def print_dict_as_table(title, data, key_label="Key", val_label="Value"):
         console.print(f"[yellow]No {title.lower()} found.[/yellow]")
         return
 
+    Table = _load("Table")
     table = Table(title=title, show_header=True, header_style="bold magenta")
     table.add_column(key_label, style="cyan", no_wrap=True)
     table.add_column(val_label, style="green")
@@ -90,6 +142,7 @@ def print_help():
   [cyan]set mem <key> <val>[/cyan]        Set memory variable
   [cyan]exit / quit[/cyan]                Exit the shell
     """
+    Panel = _load("Panel")
     console.print(Panel(help_text.strip(), title="Math Engine Commands", expand=False))
 
 
@@ -229,25 +282,24 @@ def process_input_and_evaluate(user_input):
     # contain commas inside parenthesised function calls, e.g. "max(1,2), x=3".
     # Instead we track parenthesis nesting depth and only split on commas that
     # appear at the top level (bracket_level == 0).
+    # Only parentheses and commas are visited (the regex skips everything
+    # else); the parts are then cut out of the input by slicing.
     parts = []
     bracket_level = 0
-    current_part = ""
+    part_start = 0
 
-    for char in user_input:
+    for match in _SPLIT_CHARS_RE.finditer(user_input):
+        char = match.group()
         if char == "(":
             bracket_level += 1  # entering a nested group — do not split here
-            current_part += char
         elif char == ")":
             bracket_level -= 1  # leaving a nested group
-            current_part += char
-        elif char == "," and bracket_level == 0:
+        elif bracket_level == 0:
             # Top-level comma: marks the boundary between the expression
             # and an inline variable assignment (or between assignments).
-            parts.append(current_part.strip())
-            current_part = ""
-        else:
-            current_part += char
-    parts.append(current_part.strip())  # capture the final segment
+            parts.append(user_input[part_start:match.start()].strip())
+            part_start = match.end()
+    parts.append(user_input[part_start:].strip())  # capture the final segment
 
     # The first segment is always the mathematical expression to evaluate.
     expression = parts[0]
@@ -272,10 +324,6 @@ def process_input_and_evaluate(user_input):
 
             temp_vars[key] = val
     return evaluate(expression, **temp_vars, is_cli=True)
-# Module-level completers used as fallback / reference outside the REPL.
-bool_completer = WordCompleter(['true', 'false', 'on', 'off'], ignore_case=True)
-
-word_size_completer = WordCompleter(['8', '16', '32', '64', '0'], ignore_case=True)
 
 # ---------------------------------------------------------------------------
 # Interactive mode (REPL)
@@ -299,6 +347,11 @@ def run_interactive_mode(settings = None):
     """
     if settings == None:
         load_all_settings()
+    PromptSession = _load("PromptSession")
+    WordCompleter = _load("WordCompleter")
+    NestedCompleter = _load("NestedCompleter")
+    FileHistory = _load("FileHistory")
+    Style = _load("Style")
     console.clear()
     console.print(f"[bold blue]Math Engine {__version__} Interactive Shell[/bold blue]")
     console.print("Type [bold]help[/bold] for commands, [bold]exit[/bold] to leave.\n")
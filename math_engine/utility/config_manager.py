@@ -15,6 +15,7 @@ Design Notes
 - Paths are resolved relative to the project root.
 """
 
+import os
 import sys
 import configparser
 from pathlib import Path
@@ -53,6 +54,60 @@ def load_setting_value(key_value):
         return settings_dict.get(key_value, 0)
 
 
+# --- Settings cache ---
+# Every writer in this module bumps _settings_version; together with the
+# mtime/size of config.json (external edits) it decides whether the cached
+# dictionary is still current.  The cache holds
+# ``(version, stat_key, settings)`` or ``None``.
+_settings_version = 0
+_settings_cache = None
+
+# The file-backed loader; only its results are cached (see load_all_cached()).
+_file_loader = load_setting_value
+
+
+def _invalidate_settings_cache():
+    """Mark the cached settings as stale after a write to config.json."""
+    global _settings_version
+    _settings_version += 1
+
+
+def load_all_cached():
+    """Return the full settings dictionary, re-reading config.json only when needed.
+
+    The file is re-parsed after any write through this module or when its
+    modification time / size changed on disk.  The returned dictionary is
+    shared between callers and must be treated as read-only.
+
+    Returns
+    -------
+    dict
+        Dictionary of all settings ({} on read failure, like
+        :func:`load_setting_value`).
+    """
+    global _settings_cache
+
+    # If load_setting_value has been replaced (e.g. monkeypatched), always
+    # defer to it so the replacement stays the single source of truth.
+    if load_setting_value is not _file_loader:
+        return load_setting_value("all")
+
+    try:
+        stat = os.stat(config_json)
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        stat_key = None
+
+    cache = _settings_cache
+    if cache is not None and cache[0] == _settings_version and cache[1] == stat_key:
+        return cache[2]
+
+    version = _settings_version
+    settings = load_setting_value("all")
+    _settings_cache = (version, stat_key, settings)
+    return settings
+
+
 def load_setting_description(key_value):
     """Load user-facing string descriptions from ui_strings.json.
 
@@ -88,6 +143,7 @@ def force_overwrite_settings(settings:dict):
         E.ConfigError: If the file cannot be written (code ``5002``).
     """
     try:
+            _invalidate_settings_cache()
             with open(config_json, 'w', encoding='utf-8') as f:
                 json.dump(settings, f, indent=4)
                 return 1  # Success
@@ -120,6 +176,7 @@ def reset_settings_tests():
         "readable_error":False,
         "word_size": 0
     }
+    _invalidate_settings_cache()
     with open(config_json, 'w', encoding='utf-8') as f:
         json.dump(x, f, indent=4)
         return 1
@@ -148,6 +205,7 @@ def reset_settings():
         "readable_error":False,
         "word_size": 0
     }
+    _invalidate_settings_cache()
     with open(config_json, 'w', encoding='utf-8') as f:
         json.dump(x, f, indent=4)
         return 1
@@ -301,6 +359,7 @@ def save_setting(key_value, new_value):
 
             settings[key_value] = final_prefix
 
+            _invalidate_settings_cache()
             with open(config_json, 'w', encoding='utf-8') as f:
                 json.dump(settings, f, indent=4)
                 return 1  # Success
@@ -330,6 +389,7 @@ def save_setting(key_value, new_value):
             pass
     try:
         # Use the correct file path (config_json) and dictionary (settings)
+        _invalidate_settings_cache()
         with open(config_json, 'w', encoding='utf-8') as f:
             json.dump(settings, f, indent=4)
             return 1  # Success
@@ -357,6 +417,7 @@ def load_preset(settings:dict):
             raise E.SyntaxError("Invalid dict.", code = "5002")
         else:
         # Use the correct file path (config_json) and dictionary (settings)
+            _invalidate_settings_cache()
             with open(config_json, 'w', encoding='utf-8') as f:
                 json.dump(settings, f, indent=4)
                 return 1  # Success
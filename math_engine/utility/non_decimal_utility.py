@@ -45,7 +45,7 @@ def non_decimal_scan(problem: str, b: int, settings: dict):
         E.ConversionError: If an invalid digit is encountered for the
             detected base (code ``8004``).
     """
-    from ..calculator.calculator import Operations
+    from ..calculator.calculator import OPERATOR_CHARS
     # Early exit if non-decimal literals are disabled in the settings
     if not settings.get("allow_non_decimal", False):
         return (None, b)
@@ -89,7 +89,7 @@ def non_decimal_scan(problem: str, b: int, settings: dict):
             elif char_a in forbidden_char:
                 # Decimal points and commas are not valid in non-decimal literals
                 break
-            elif char_a in Operations or char_a == " " or char_a in "()":
+            elif char_a in OPERATOR_CHARS or char_a == " " or char_a in "()":
                 # An operator, space, or parenthesis marks the end of the literal
                 break
             else:
@@ -165,10 +165,8 @@ def int_to_value(number, output_prefix, settings):
     if isinstance(number, (Decimal, float, int)) and number % 1 != 0:
         raise E.ConversionError("Cannot convert non-integer value to non decimal.", code="8003")
     try:
-        if isinstance(number, Decimal):
-            number = int(number.to_integral_value())
-        else:
-            number = int(number)
+        # Integral at this point, so int() needs no rounding step first
+        number = int(number)
     except Exception:
         raise E.ConversionError("Input could not be converted to a Python integer.", code="8004")
 
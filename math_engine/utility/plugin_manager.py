@@ -15,15 +15,15 @@ Architecture:
 """
 
 import decimal
+import logging
+import os
 from pathlib import Path
 from abc import ABC, abstractmethod
-import importlib.util
-import importlib.machinery
 import sys
 from typing import Union, Optional
 from ..utility import error as E
-import inspect
-from inspect import isclass
+
+logger = logging.getLogger(__name__)
 
 # Reference blueprint showing the expected structure of a plugin registration.
 # Every plugin's ``register_function()`` must return a dict with exactly these
@@ -49,6 +49,10 @@ allowed_types = Union[str, decimal.Decimal, bool, int, float]
 forbidden_division_types = ['(', ')']
 """Characters that cannot be used as argument dividers in plugin functions."""
 
+# Hashed copies for the membership checks in validate_registered_function().
+_ALLOWED_TYPES = frozenset(allowed_types.__args__)
+_FORBIDDEN_DIVIDERS = frozenset(forbidden_division_types)
+
 function_register = {}
 """Global registry of loaded plugin functions.
 
@@ -56,6 +60,17 @@ Keys are function names with a trailing ``(`` (e.g., ``"ln("``).
 Values are the validated blueprint dictionaries.
 """
 
+_plugin_version = 0
+"""Bumped on every change to :data:`function_register`; lets the tokenizer
+skip its plugin sync with one integer comparison while nothing changed."""
+
+_plugin_scan_cache = {"entries": None, "blueprints": None}
+"""Result of the last :func:`find_plugins` scan.
+
+``entries`` holds ``(name, mtime_ns, size)`` of every plugin file; while the
+folder still lists exactly these files, the cached ``blueprints`` are
+registered again instead of loading every module again."""
+
 
 
 class BasePlugin(ABC):
@@ -132,10 +147,11 @@ def validate_registered_function(function):
         raise E.PluginError(f"More than 5 keys in '{function}' registered: {len(function)}", code = "9001")
     else:
         try:
-            item_list = list(function.items())
-
-            values_to_check = list(function.values())
-            keys_to_check = [item_list[i][0] for i in range(4)]
+            # One walk over the dict each for keys and values; the rules
+            # below index into these tuples.
+            keys = (*function,)
+            values_to_check = (*function.values(),)
+            keys_to_check = [keys[i] for i in range(4)]
 
             # --- Rule 3: All blueprint keys must be strings ---
             if not all(isinstance(key, str) for key in keys_to_check):
@@ -155,7 +171,8 @@ def validate_registered_function(function):
                 raise E.PluginError(f"Invalid number of arguments type. Valid type: int"
                                     f"received type: {type(values_to_check[1])}", code = "9003")
             # --- Rule 6: "type" must be one of the allowed_types ---
-            if values_to_check[2] not in allowed_types.__args__:
+            # isinstance() first: an unhashable value is simply not a valid type
+            if not isinstance(values_to_check[2], type) or values_to_check[2] not in _ALLOWED_TYPES:
                 raise E.PluginError(f"Type is not valid. Valid types: {allowed_types.__args__}", code="9003")
 
             # --- Rule 7: "divided_by" must be a string ---
@@ -166,18 +183,16 @@ def validate_registered_function(function):
             # --- Rule 8: Default the divider to ',' if empty or None ---
             divider_value = values_to_check[3]
             if divider_value == "" or divider_value is None:
-                key_to_update = list(function.keys())[3]
-
-                function[key_to_update] = ","
+                function[keys[3]] = ","
             # --- Rule 9: '(' and ')' are forbidden as dividers ---
-            if divider_value in forbidden_division_types:
+            if divider_value in _FORBIDDEN_DIVIDERS:
                 raise E.PluginError(
                     f"Divider '{divider_value}' is forbidden. Forbidden types: {forbidden_division_types}",
                     code="9004"
                 )
             # --- Rule 10: "implementation_class" must be a class reference ---
             plugin_class_reference = values_to_check[4]
-            if not isclass(plugin_class_reference):
+            if not isinstance(plugin_class_reference, type):
                 raise E.PluginError(
                     f"5th must be a class. Received type: {type(plugin_class_reference).__name__}",
                     code="9005")
@@ -194,15 +209,17 @@ def validate_registered_function(function):
 
     # Ensure the function name ends with '(' so the tokenizer can recognize
     # it as a callable (e.g. "ln" becomes "ln(").
-    name = list(function.values())[0]
+    name = values_to_check[0]
     if name.endswith("("):
         pass
     elif name.endswith(")"):
         raise E.PluginError("Function names cannot ned with ')'", code = "9011")
     else:
         name = name + "("
+    global _plugin_version
     function_register[name] = function
-    print(function_register)
+    _plugin_version += 1
+    logger.debug("Plugin function registered: %s (register: %s)", name, function_register)
 
 
 
@@ -217,7 +234,10 @@ def find_plugins():
 
     Iterates over all ``.py`` files in the plugins folder (skipping
     ``__init__.py``), loads each module, extracts the ``BasePlugin``
-    subclass, and validates its blueprint.
+    subclass, and validates its blueprint.  While no plugin file was added,
+    removed or modified since the previous call, the blueprints of that call
+    are validated and registered again without loading the modules, so
+    :data:`function_register` is complete even if it was cleared meanwhile.
 
     Returns:
         list[dict]: A list of validated plugin blueprint dictionaries.
@@ -234,25 +254,35 @@ def find_plugins():
             code="9011"
         )
 
-    found_blueprints = []
-
-    print(f"Scanning folder: {plugin_folder.absolute()}")
+    logger.debug("Scanning folder: %s", plugin_folder)
 
-    for file in plugin_folder.glob("*.py"):
-        if file.name == "__init__.py":
-            continue
+    # One scandir() pass; the stat results double as the cache key, so an
+    # added, removed or edited plugin file triggers a full reload.
+    plugin_files = []
+    with os.scandir(plugin_folder) as scan:
+        for entry in scan:
+            if entry.name.endswith(".py") and entry.name != "__init__.py":
+                stat = entry.stat()
+                plugin_files.append((entry.name, entry.path, stat.st_mtime_ns, stat.st_size))
 
-        print(f"Plugin file discovered: {file.name}")
-        try:
-            plugin_blueprint = _load_module_and_extract_class(file)
+    entries = [(name, mtime, size) for name, _, mtime, size in plugin_files]
+    if entries == _plugin_scan_cache["entries"]:
+        for plugin_blueprint in _plugin_scan_cache["blueprints"]:
+            validate_registered_function(plugin_blueprint)
+        return list(_plugin_scan_cache["blueprints"])
 
-            if plugin_blueprint:
-                found_blueprints.append(plugin_blueprint)
+    found_blueprints = []
 
-        except E.PluginError as e:
-            raise e
+    for file_name, file_path, _, _ in plugin_files:
+        logger.debug("Plugin file discovered: %s", file_name)
+        # A PluginError from loading or validation propagates unchanged
+        plugin_blueprint = _load_module_and_extract_class(Path(file_path))
+        if plugin_blueprint:
+            found_blueprints.append(plugin_blueprint)
 
-    return found_blueprints
+    _plugin_scan_cache["entries"] = entries
+    _plugin_scan_cache["blueprints"] = found_blueprints
+    return list(found_blueprints)
 
 
 def _load_module_and_extract_class(plugin_path: Path) -> Optional[dict]:
@@ -274,34 +304,48 @@ def _load_module_and_extract_class(plugin_path: Path) -> Optional[dict]:
         E.PluginError: If the module fails to load (code ``9007``),
             instantiation fails (code ``9008``), or validation fails.
     """
+    # Only needed once plugins are actually loaded; keeps it out of
+    # ``import math_engine``.
+    import importlib.util
+
     module_name = plugin_path.stem
     full_module_name = f"math_engine.plugins.{module_name}"
     try:
-        spec = importlib.util.spec_from_file_location(full_module_name, plugin_path)
-        if spec is None:
-            raise ImportError(f"Could not load spec for {full_module_name}")
-
-        module = importlib.util.module_from_spec(spec)
-
-        module.__package__ = "math_engine.plugins"
-        module.BasePlugin = BasePlugin
-
-        sys.modules[full_module_name] = module
-        spec.loader.exec_module(module)
+        # Reuse the module from an earlier load while its file is unchanged;
+        # only new or edited plugin files are executed again.
+        stat = plugin_path.stat()
+        file_stamp = (stat.st_mtime_ns, stat.st_size)
+        module = sys.modules.get(full_module_name)
+        if (module is None or getattr(module, "__file__", None) != str(plugin_path)
+                or getattr(module, "_plugin_file_stamp", None) != file_stamp):
+            spec = importlib.util.spec_from_file_location(full_module_name, plugin_path)
+            if spec is None:
+                raise ImportError(f"Could not load spec for {full_module_name}")
+
+            module = importlib.util.module_from_spec(spec)
+
+            module.__package__ = "math_engine.plugins"
+            module.BasePlugin = BasePlugin
+
+            sys.modules[full_module_name] = module
+            spec.loader.exec_module(module)
+            module._plugin_file_stamp = file_stamp
 
     except Exception as e:
         error_type = type(e).__name__
         raise E.PluginError(f"Error Loading Plugin {module_name} ({error_type}): {e}", code="9007")
 
-    # Search for the first class in the module that inherits from BasePlugin.
-    PluginKlasse = None
-    for name, obj in inspect.getmembers(module, inspect.isclass):
-        if obj != BasePlugin and issubclass(obj, BasePlugin):
-            PluginKlasse = obj
-            break
+    # Search for the first class (in attribute-name order, as
+    # inspect.getmembers() returned them) that inherits from BasePlugin.
+    # Read straight from the module dict: no dir() walk, no getattr() per name.
+    plugin_classes = {
+        name: obj for name, obj in vars(module).items()
+        if isinstance(obj, type) and obj is not BasePlugin and issubclass(obj, BasePlugin)
+    }
+    PluginKlasse = plugin_classes[min(plugin_classes)] if plugin_classes else None
 
     if PluginKlasse is None:
-        print(f"WARNUNG: Keine von BasePlugin abgeleitete Klasse in {module_name}.py gefunden.")
+        logger.warning("No BasePlugin subclass found in %s.py.", module_name)
         return None
 
     # Instantiate the discovered plugin class and validate its blueprint.
@@ -11,7 +11,6 @@ concerns.
 """
 
 from decimal import Decimal
-import inspect
 from . import error as E
 
 # ---------------------------------------------------------------------------
@@ -76,6 +75,7 @@ def isDecimal(value):
 
 def get_line_number():
     """Return the caller line number (small debug helper)."""
+    import inspect  # only needed here; keeps it out of package import time
     return inspect.currentframe().f_back.f_lineno
 
 
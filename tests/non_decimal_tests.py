@@ -617,6 +617,48 @@ def test_bitwise_fails_on_float():
     assert exc.value.code in ("3041", "3042", "8003")
 
 
+@pytest.mark.parametrize("expr", ["(7**120) & 1", "(7**200) & 1", "2 >> 0**-3"])
+def test_bitwise_rejects_rounded_or_infinite_operands(expr):
+    """Operands wider than the precision or infinite raise 3026, not a wrong result."""
+    with pytest.raises(E.CalculationError) as exc:
+        math_engine.evaluate(expr)
+    assert exc.value.code == "3026"
+
+
+@pytest.mark.parametrize("expr", ["bitand(7**200, 1)", "testbit(7**200, 0)",
+                                  "bitxor(3**250, 3**250)", "bitnot(7**200)"])
+def test_bit_functions_reject_arguments_wider_than_precision(expr):
+    with pytest.raises(E.CalculationError) as exc:
+        math_engine.evaluate(expr)
+    assert exc.value.code == "3026"
+
+
+def test_bitwise_on_right_side_of_equation():
+    """'|', '^' and '&' after '=' are part of the right-hand side."""
+    load_defaults()
+    # Equality checks compare against the whole right-hand expression
+    assert math_engine.evaluate("1 = 0 | 1") is True
+    assert math_engine.evaluate("3 = 1 ^ 2") is True
+    assert math_engine.evaluate("0 = 1 & 2") is True
+    # The linear solver rejects bitwise operators on either side
+    with pytest.raises(E.CalculationError) as exc:
+        math_engine.evaluate("x = 5 | 3")
+    assert exc.value.code == "3004"
+    assert exc.value.position_start == 6
+    with pytest.raises(E.CalculationError) as exc:
+        math_engine.evaluate("5 | 3 = x")
+    assert exc.value.code == "3004"
+
+
+def test_solver_rejects_bitwise_right_side():
+    """solve() itself raises 3004 for a bitwise node right of '='."""
+    from math_engine.calculator import calculator as calc_mod
+    tree = calc_mod.ast("x = 5 | 3", config_manager.load_all_cached(), {})[0]
+    with pytest.raises(E.CalculationError) as exc:
+        calc_mod.solve(tree, "var0")
+    assert exc.value.code == "3004"
+
+
 # ---------------------------------------------------------------------------
 # 15) Operator Precedence (Advanced)
 # ---------------------------------------------------------------------------
@@ -822,6 +864,12 @@ def test_setbit_requires_integer_arguments():
     assert exc.value.code == "3041"
 
 
+def test_setbit_accepts_integral_decimals():
+    load_defaults()
+    # 2.5*2 == 5.0 has a fractional exponent but is still an integer
+    assert math_engine.evaluate("setbit(2.5*2, 1)") == Decimal(7)
+
+
 # --- clrbit ---------------------------------------------------------------
 
 def test_clrbit_basic():
@@ -1182,6 +1230,16 @@ def test_save_setting_io_error():
             assert exc.value.code == "5002"
 
 
+def test_load_all_cached_reuses_and_invalidates():
+    """Cache liefert dasselbe Dict, bis über config_manager geschrieben wird."""
+    first = config_manager.load_all_cached()
+    assert config_manager.load_all_cached() is first
+    config_manager.save_setting("decimal_places", 5)
+    refreshed = config_manager.load_all_cached()
+    assert refreshed is not first
+    assert refreshed["decimal_places"] == 5
+
+
 # ---------------------------------------------------------------------------
 # 2. Tests für load_setting_description (UI Strings)
 # ---------------------------------------------------------------------------
@@ -2474,10 +2532,109 @@ def test_all_bit_operations_combined_expression():
     result = math_engine.evaluate(expr)
     assert result == 344
 
+def test_function_trie_prefers_longest_prefix():
+    from math_engine.calculator.calculator import _FuncTrie
+    trie = _FuncTrie({"pi": ("π", 2), "pick(": ("pick", 5)})
+    assert trie.longest_match("2*pick(3)", 2) == ("pick", 5)
+    assert trie.longest_match("2*pi", 2) == ("π", 2)
+    assert trie.longest_match("2*pa", 2) is None
+
+def test_pi_constant_keeps_token_spans_in_sync():
+    from math_engine.calculator import calculator as calc_mod
+    tokens, _, spans = calc_mod.translator("2π", {}, config_manager.load_all_cached())
+    assert len(tokens) == len(spans)
+    assert math_engine.evaluate("dec:π") == Decimal("3.14")
+    assert math_engine.evaluate("dec:2π") == Decimal("6.28")
+    with pytest.raises(E.CalculationError) as exc:
+        math_engine.evaluate("π+")
+    assert exc.value.code == "3029"
+    assert exc.value.position_start == 1
+
+def test_plugin_sync_follows_version_counter(monkeypatch):
+    from math_engine.calculator import calculator as calc_mod
+    from math_engine.utility import plugin_manager
+    settings = config_manager.load_all_cached()
+    monkeypatch.setitem(plugin_manager.function_register, "qux(", {})
+    monkeypatch.setattr(calc_mod, "RAW_FUNCTION_MAP", dict(calc_mod.RAW_FUNCTION_MAP))
+    monkeypatch.setattr(calc_mod, "plugin_operations", list(calc_mod.plugin_operations))
+    monkeypatch.setattr(calc_mod, "_synced_plugin_version", calc_mod._synced_plugin_version)
+    try:
+        # Not picked up until the registry version changes
+        calc_mod.translator("2", {}, settings)
+        assert "qux(" not in calc_mod.RAW_FUNCTION_MAP
+        monkeypatch.setattr(plugin_manager, "_plugin_version", plugin_manager._plugin_version + 1)
+        assert calc_mod.translator("qux(2)", {}, settings)[0][:2] == ["qux", "("]
+    finally:
+        monkeypatch.undo()
+        calc_mod.update_function_globals()
+
+def test_find_plugins_registers_again_on_unchanged_folder(tmp_path, monkeypatch):
+    from math_engine.utility import plugin_manager
+    (tmp_path / "plugins").mkdir()
+    (tmp_path / "plugins" / "tripler.py").write_text(
+        "class Tripler(BasePlugin):\n"
+        "    def register_function(self):\n"
+        "        return {'function': 'tripler', 'number_of_parameters': 1, 'type': int,\n"
+        "                'divided_by': ',', 'implementation_class': Tripler}\n"
+        "    def execute(self, problem):\n"
+        "        pass\n"
+    )
+    monkeypatch.setattr(plugin_manager, "__file__", str(tmp_path / "plugin_manager.py"))
+    monkeypatch.setattr(plugin_manager, "_plugin_scan_cache", {"entries": None, "blueprints": None})
+    monkeypatch.setattr(plugin_manager, "_plugin_version", plugin_manager._plugin_version)
+    monkeypatch.delitem(plugin_manager.function_register, "tripler(", raising=False)
+    monkeypatch.delitem(sys.modules, "math_engine.plugins.tripler", raising=False)
+
+    plugin_manager.find_plugins()
+    del plugin_manager.function_register["tripler("]
+    # Unchanged folder: served from the scan cache, but still registered
+    blueprints = plugin_manager.find_plugins()
+    assert [blueprint["function"] for blueprint in blueprints] == ["tripler"]
+    assert plugin_manager.function_register["tripler("] is blueprints[0]
+
+def test_parse_cache_parses_repeated_input_once():
+    from math_engine.calculator import calculator as calc_mod
+    math_engine.clear_cache()
+    with patch.object(calc_mod, "ast", wraps=calc_mod.ast) as parse:
+        assert math_engine.evaluate("2*x=8") == 4
+        assert math_engine.evaluate("2*x=8") == 4
+        assert parse.call_count == 1
+        # clear_cache() forces the next evaluation to parse again
+        math_engine.clear_cache()
+        assert math_engine.evaluate("2*x=8") == 4
+        assert parse.call_count == 2
+    assert math_engine.evaluate("a*2", a=2) == 4
+    assert math_engine.evaluate("a*2", a=2.5) == 5
+
+
+def test_translator_cache_returns_fresh_lists():
+    from math_engine.calculator import calculator as calc_mod
+    settings = math_engine.utility.config_manager.load_all_cached()
+    tokens, _, spans = calc_mod.cached_translator("2x+1", {}, settings)
+    tokens.clear()
+    spans.clear()
+    again, var_counter, again_spans = calc_mod.cached_translator("2x+1", {}, settings)
+    assert again == [Decimal(2), "*", "var0", "+", Decimal(1)]
+    assert var_counter == 1 and len(again_spans) == 5
+
 def test_reset():
     math_engine.utility.config_manager.reset_settings_tests()
 
 
+def test_calculate_does_not_change_caller_decimal_context():
+    """calculate() arbeitet in einem eigenen Decimal-Kontext."""
+    from decimal import getcontext
+    before = getcontext().prec
+    math_engine.evaluate("1/3")
+    assert getcontext().prec == before
+
+
+def test_set_precision_rejects_invalid_values():
+    with pytest.raises(E.ConfigError) as exc:
+        math_engine.set_precision(0)
+    assert exc.value.code == "5004"
+
+
 # ---------------------------------------------------------------------------
 # Coverage: AST_Node_Types.py
 # ---------------------------------------------------------------------------
@@ -2607,6 +2764,19 @@ class TestBinOpCollectTermDivision:
         assert exc.value.code == "3006"
 
 
+class TestBinOpCollectTermDeepTree:
+    def test_collect_term_beyond_recursion_limit(self):
+        # var0 + var0 + ... (5000 terms) nests 4999 BinOps deep
+        tree = Variable("var0")
+        for _ in range(4999):
+            tree = BinOp(tree, "+", Variable("var0"))
+        assert tree.collect_term("var0") == (5000, 0)
+
+    def test_solve_long_sum(self):
+        load_defaults(decimal_places=4)
+        assert math_engine.evaluate("dec:" + "x+" * 4999 + "x=1") == Decimal("0.0002")
+
+
 class TestBinOpCollectTermPower:
     def test_power_raises(self):
         left = Number(2)
@@ -2627,6 +2797,157 @@ class TestBinOpCollectTermEquality:
         assert exc.value.code == "3720"
 
 
+class TestBinOpUnknownOperator:
+    def test_unknown_operator_raises_at_construction(self):
+        with pytest.raises(E_mod.CalculationError) as exc:
+            BinOp(Number(1), "%", Number(2))
+        assert exc.value.code == "3004"
+
+    def test_bitwise_operator_not_collectable(self):
+        with pytest.raises(E_mod.CalculationError) as exc:
+            BinOp(Number(1), "&", Number(2)).collect_term("var0")
+        assert exc.value.code == "3004"
+
+
+def _big_int_backends():
+    yield int
+    try:
+        from gmpy2 import mpz
+    except ImportError:
+        yield pytest.param(None, marks=pytest.mark.skip(reason="gmpy2 not installed"))
+    else:
+        yield mpz
+
+
+class TestIntegerPower:
+    @pytest.mark.parametrize("backend", list(_big_int_backends()))
+    def test_eval_pow_backends(self, backend, monkeypatch):
+        from decimal import localcontext
+        from math_engine.calculator import AST_Node_Types as nodes
+        monkeypatch.setattr(nodes, "_big_int", backend)
+        with localcontext() as ctx:
+            ctx.prec = 100
+            assert nodes._eval_pow(Decimal(-3), Decimal(41), None) == Decimal((-3) ** 41)
+            assert nodes._eval_pow(Decimal(7), Decimal(500), None) == Decimal(7) ** Decimal(500)
+            assert nodes._eval_pow(Decimal("2.5"), Decimal(3), None) == Decimal("15.625")
+
+    @pytest.mark.parametrize("base", [3, -5, 1000])
+    def test_fast_path_boundary_matches_decimal(self, base):
+        from decimal import localcontext
+        from math_engine.calculator import AST_Node_Types as nodes
+        largest = nodes._INT_POW_MAX_BITS // abs(base).bit_length()
+        with localcontext() as ctx:
+            ctx.prec = 100
+            # Last exponent on the integer path and first one past it
+            for exponent in (largest, largest + 1):
+                expected = Decimal(base) ** Decimal(exponent)
+                assert nodes._eval_pow(Decimal(base), Decimal(exponent), None) == expected
+
+
+class TestBinOpConstantFolding:
+    def test_constant_subtree_value(self):
+        b = BinOp(BinOp(Number(2), "*", Number(3)), "+", Number(1))
+        assert b.evaluate() == 7
+        assert b.collect_term("var0") == (0, 7)
+
+    def test_failed_fold_raises_on_evaluation(self):
+        # Construction must not raise; the error surfaces when evaluated
+        b = BinOp(Number(1), "/", Number(0))
+        with pytest.raises(E_mod.CalculationError) as exc:
+            b.evaluate()
+        assert exc.value.code == "3003"
+
+    def test_folding_keeps_solver_errors(self):
+        b = BinOp(BinOp(Number(2), "**", Number(3)), "+", Number(1))
+        assert b.evaluate() == 9
+        with pytest.raises(E_mod.SolverError) as exc:
+            b.collect_term("var0")
+        assert exc.value.code == "3007"
+
+    def test_constant_operands_fold_next_to_variables(self):
+        assert math_engine.evaluate("(2+3)*(4+5)+x=0") == -45
+        assert math_engine.evaluate("(2+3)*(4+5)*x=90") == 2
+        func = math_engine.compile_expression("(2+3)*(4+5)+x")
+        assert func(x=1) == 46
+
+    def test_prune_constants_collapses_folded_subtrees(self):
+        from math_engine.calculator.AST_Node_Types import prune_constants
+        b = BinOp(BinOp(Number(2), "*", Number(3)), "=", BinOp(Number(5), "+", Number(1)))
+        pruned = prune_constants(b)
+        assert pruned is b
+        assert isinstance(b.left, Number) and b.left.value == 6
+        assert isinstance(b.right, Number) and b.right.value == 6
+        assert isinstance(prune_constants(BinOp(Number(1), "&", Number(3))), Number)
+
+
+class TestBinOpBytecode:
+    def test_run_with_bound_variable(self):
+        # 2 * var0 + 1 with var0 = 5  =>  11
+        from math_engine.calculator.AST_Node_Types import run
+        b = BinOp(BinOp(Number(2), "*", Variable("var0")), "+", Number(1))
+        code, consts, names = b.compile()
+        assert names == ["var0"]
+        assert run(code, consts, {"var0": Decimal(5)}) == 11
+
+    def test_deep_tree_does_not_recurse(self):
+        b = Number(0)
+        for _ in range(5000):
+            b = BinOp(b, "+", Number(1))
+        assert b.evaluate() == 5000
+
+
+class TestEvaluateBatch:
+    def test_evaluate_batch(self):
+        np = pytest.importorskip("numpy")
+        result = math_engine.evaluate_batch("3*x + y", x=np.arange(4), y=[3, 4, 5, 6])
+        assert list(result) == [3, 7, 11, 15]
+
+    def test_evaluate_batch_bitwise_requires_integers(self):
+        pytest.importorskip("numpy")
+        with pytest.raises(E_mod.CalculationError) as exc:
+            math_engine.evaluate_batch("x & 1", x=[1.5])
+        assert exc.value.code == "3042"
+
+    def test_evaluate_batch_names_missing_variable(self):
+        with pytest.raises(E_mod.SolverError) as exc:
+            math_engine.evaluate_batch("3*x + y", x=[1, 2])
+        assert exc.value.code == "3005"
+        assert "'y'" in exc.value.message
+
+    def test_import_does_not_load_numpy(self):
+        import subprocess
+        code = "import sys, math_engine; print('numpy' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+        assert result.stdout.strip() == "False"
+
+
+class TestFloatCompiler:
+    def test_compile_float(self):
+        from math_engine.calculator.float_compiler import compile_float
+        b = BinOp(BinOp(Variable("var0"), "*", Number("2.5")), "-", Variable("var1"))
+        func, names = compile_float(b)
+        assert names == ["var0", "var1"]
+        assert func(4, 1) == 9.0
+
+    def test_division_by_zero_falls_back_to_decimal(self):
+        from math_engine.calculator.float_compiler import compile_float
+        func, _ = compile_float(BinOp(Number(1), "/", Variable("var0")))
+        with pytest.raises(E_mod.CalculationError) as exc:
+            func(0)
+        assert exc.value.code == "3003"
+
+    def test_non_finite_constant_uses_exact_path(self):
+        func = math_engine.compile_expression("x+1e400")
+        assert func(x=1) == Decimal("1e400") + 1
+
+    def test_compile_expression(self):
+        func = math_engine.compile_expression("x**2 + 3*x")
+        assert func(x=2.5) == 13.75
+        with pytest.raises(E_mod.SolverError) as exc:
+            func()
+        assert exc.value.code == "3005"
+
+
 # ---------------------------------------------------------------------------
 # Coverage: utility.py
 # ---------------------------------------------------------------------------
@@ -2943,6 +3264,13 @@ class TestVariousErrorPaths:
         result = math_engine.evaluate("2=3")
         assert result is False
 
+    def test_equality_identical_sides_still_evaluated(self):
+        """Identical sides are not short-circuited: their errors still surface."""
+        assert math_engine.evaluate("(2+3)*4=(2+3)*4") is True
+        with pytest.raises(E.CalculationError) as exc:
+            math_engine.evaluate("1/0=1/0")
+        assert exc.value.code == "3003"
+
     def test_output_zero_result(self):
         """Result of zero formats as '0' (not '0E-2' etc.)."""
         result = math_engine.evaluate("1-1")
@@ -3397,6 +3725,15 @@ def test_cov_negative_decimal_places():
     assert isinstance(result, _Decimal)
 
 
+def test_cov_cleanup_legacy_float():
+    """Floats are rounded only when their repr has too many decimals."""
+    from math_engine.calculator.calculator import cleanup
+    settings = {"decimal_places": 2, "fractions": False}
+    assert cleanup(1e-20, settings) == (1e-20, False)
+    assert cleanup(0.125, settings) == (0.12, True)
+    assert cleanup(0.5, settings) == (0.5, False)
+
+
 def test_cov_fraction_integer_result():
     """Cover fraction mode with integer result (no remainder)."""
     _preset(fractions=True)